@@ -3,11 +3,28 @@ Configuration settings for the Unified Data Access Platform.
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
 
 
-@dataclass
+# SQLite PRAGMAs applied to every metadata store connection unless the
+# caller passes its own. WAL lets API reads proceed while a discover is
+# writing, and busy_timeout makes concurrent writers wait briefly instead
+# of failing with SQLITE_BUSY. Read-only so the shared default cannot be
+# changed by one caller under another.
+DEFAULT_SQLITE_PRAGMAS: Mapping[str, Union[str, int]] = MappingProxyType({
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+    "mmap_size": 268435456,
+})
+
+
+@dataclass(frozen=True)
 class AWSConfig:
     """AWS configuration settings."""
     
@@ -25,12 +42,17 @@ class AWSConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration settings."""
     
     type: str = "sqlite"  # sqlite or postgresql
     path: str = "metadata.db"  # For SQLite
+    # SQLite PRAGMAs applied on every connection. A mapping cannot be
+    # hashed, so it is left out of the frozen dataclass's __hash__.
+    pragmas: Mapping[str, Union[str, int]] = field(
+        default_factory=lambda: DEFAULT_SQLITE_PRAGMAS, hash=False
+    )
     
     # For PostgreSQL (future)
     host: Optional[str] = None
@@ -62,7 +84,7 @@ class DatabaseConfig:
             raise ValueError(f"Unsupported database type: {db_type}")
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlatformConfig:
     """Main platform configuration."""
     
@@ -87,3 +109,14 @@ class PlatformConfig:
             database=DatabaseConfig(),
             log_level="INFO"
         )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> PlatformConfig:
+    """
+    Return the platform configuration loaded from the environment.
+    
+    The environment is read once per process and the frozen instance is
+    shared; call get_config.cache_clear() to reload it (e.g. in tests).
+    """
+    return PlatformConfig.from_env()
@@ -1,20 +1,41 @@
 """
 Run the FastAPI server for the Unified Data Access Platform.
+
+Runs in dev mode (auto-reload, per-request access logs) by default. Set
+ENV=production to run multiple workers on uvloop/httptools without access
+logging.
 """
 
+import os
+
 import uvicorn
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 if __name__ == "__main__":
-    logger.info("Starting FastAPI server...")
-    
+    is_dev = os.getenv("ENV", "dev") != "production"
+    logger.info("Starting FastAPI server (%s mode)...", "dev" if is_dev else "production")
+
+    if is_dev:
+        server_options = {
+            "reload": True,
+            "workers": 1,
+            "access_log": True,
+        }
+    else:
+        server_options = {
+            "reload": False,
+            "workers": min(os.cpu_count() or 1, 4),
+            "access_log": False,
+            "loop": "uvloop",
+            "http": "httptools",
+        }
+
     uvicorn.run(
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
         log_level="info",
-        access_log=True
+        **server_options
     )
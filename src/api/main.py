@@ -2,19 +2,48 @@
 FastAPI application for Unified Data Access Platform API.
 """
 
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
+import asyncio
+import json
 import sys
+import time
 
-from .routes import router
-from .models import HealthResponse, ErrorResponse
+from .routes import router, get_engine
+from .models import HealthResponse
 from ..utils.logger import setup_logger
 from ..utils.exceptions import PlatformException
+from ..main import MetadataDiscoveryEngine
+from config.settings import get_config
 
 logger = setup_logger(__name__)
 
+# /health is polled frequently by load balancers; reuse the table count
+# (and the time it was taken) for a few seconds instead of hitting SQLite
+# on every probe.
+HEALTH_CACHE_TTL_SECONDS = 5.0
+_health_cache = {"expires_at": 0.0, "tables_count": 0, "timestamp": None}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the shared discovery engine at startup and close it on shutdown."""
+    logger.info("Starting Unified Data Access Platform API")
+    logger.info("Python version: %s", sys.version)
+    app.state.engine = MetadataDiscoveryEngine(
+        db_path="metadata.db",
+        db_pragmas=get_config().database.pragmas,
+    )
+    logger.info("API documentation available at: /docs")
+    yield
+    logger.info("Shutting down Unified Data Access Platform API")
+    app.state.engine.close()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Unified Data Access Platform API",
@@ -42,6 +71,7 @@ app = FastAPI(
     license_info={
         "name": "Proprietary",
     },
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -67,31 +97,51 @@ app.add_middleware(
 app.include_router(router)
 
 
+@app.middleware("http")
+async def log_requests(request: Request, call_next):
+    """Log one structured JSON line per request once it completes."""
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        logger.info("%s", json.dumps({
+            "method": request.method,
+            "path": request.url.path,
+            "query": request.url.query or None,
+            "status": status_code,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            "table_format": getattr(request.state, "table_format", None),
+        }))
+
+
 @app.exception_handler(PlatformException)
 async def platform_exception_handler(request: Request, exc: PlatformException):
     """Handle platform-specific exceptions."""
-    logger.error(f"Platform exception: {exc.message}")
+    logger.error("Platform exception: %s", exc.message)
     return JSONResponse(
         status_code=500,
-        content=ErrorResponse(
-            success=False,
-            error=exc.message,
-            details=exc.details
-        ).model_dump()
+        content={
+            "success": False,
+            "error": exc.message,
+            "details": exc.details
+        }
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}")
+    logger.error("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
-        content=ErrorResponse(
-            success=False,
-            error="Internal server error",
-            details={"message": str(exc)}
-        ).model_dump()
+        content={
+            "success": False,
+            "error": "Internal server error",
+            "details": {"message": str(exc)}
+        }
     )
 
 
@@ -107,27 +157,33 @@ async def root():
 
 
 @app.get("/health", response_model=HealthResponse, tags=["health"])
-async def health_check():
+async def health_check(request: Request, response: Response):
     """
     Health check endpoint.
     
-    Returns system status and basic metrics.
+    Returns system status and basic metrics. Healthy responses carry an
+    ETag derived from the table count, so probes sending If-None-Match
+    get an empty 304 while nothing has changed.
     """
     try:
-        from .routes import get_engine
+        table_count, timestamp = await asyncio.to_thread(
+            _get_cached_table_count, get_engine(request)
+        )
         
-        engine = get_engine()
-        table_count = engine.metadata_store.get_table_count()
+        etag = f'"{table_count}-1.0.0"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         
         return HealthResponse(
             status="healthy",
             version="1.0.0",
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             database_connected=True,
             tables_count=table_count
         )
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         return HealthResponse(
             status="unhealthy",
             version="1.0.0",
@@ -137,15 +193,11 @@ async def health_check():
         )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event."""
-    logger.info("Starting Unified Data Access Platform API")
-    logger.info(f"Python version: {sys.version}")
-    logger.info("API documentation available at: /docs")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event."""
-    logger.info("Shutting down Unified Data Access Platform API")
+def _get_cached_table_count(engine: MetadataDiscoveryEngine) -> tuple[int, datetime]:
+    """Return (table count, time it was read), refreshed at most once per TTL."""
+    now = time.monotonic()
+    if now >= _health_cache["expires_at"]:
+        _health_cache["tables_count"] = engine.metadata_store.get_table_count()
+        _health_cache["timestamp"] = datetime.now()
+        _health_cache["expires_at"] = now + HEALTH_CACHE_TTL_SECONDS
+    return _health_cache["tables_count"], _health_cache["timestamp"]
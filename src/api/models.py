@@ -2,8 +2,8 @@
 Pydantic models for API requests and responses.
 """
 
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -14,8 +14,7 @@ class ColumnResponse(BaseModel):
     nullable: bool
     comment: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
 
 
 class TableMetadataResponse(BaseModel):
@@ -25,7 +24,7 @@ class TableMetadataResponse(BaseModel):
     location: str
     columns: List[ColumnResponse]
     partitions: List[str]
-    properties: Dict[str, str]
+    properties: dict[str, str]
     supports_time_travel: bool
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -33,20 +32,20 @@ class TableMetadataResponse(BaseModel):
     size_bytes: Optional[int] = None
     row_count: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
 
 
 class DiscoverTableRequest(BaseModel):
     """Request model for discovering table metadata."""
     s3_path: str = Field(..., description="S3 path to the table (e.g., s3://bucket/warehouse/table)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "s3_path": "s3://my-bucket/warehouse/sales_data"
             }
         }
+    )
 
 
 class DiscoverTableResponse(BaseModel):
@@ -61,6 +60,7 @@ class ListTablesResponse(BaseModel):
     success: bool
     count: int
     tables: List[str]
+    table_metadata: Optional[List[TableMetadataResponse]] = None
 
 
 class GetTableResponse(BaseModel):
@@ -80,7 +80,7 @@ class ErrorResponse(BaseModel):
     """Error response model."""
     success: bool = False
     error: str
-    details: Optional[Dict] = None
+    details: Optional[dict[str, Any]] = None
 
 
 class HealthResponse(BaseModel):
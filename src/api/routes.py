@@ -2,7 +2,10 @@
 API routes for the Unified Data Access Platform.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path
+import asyncio
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
 from typing import Optional, List
 
 from .models import (
@@ -15,6 +18,7 @@ from .models import (
     ColumnResponse,
 )
 from ..main import MetadataDiscoveryEngine
+from ..models.table_metadata import TableMetadata
 from ..utils.exceptions import (
     PlatformException,
     FormatDetectionError,
@@ -23,26 +27,82 @@ from ..utils.exceptions import (
     StorageError,
 )
 from ..utils.logger import setup_logger
+from ..utils.s3_utils import S3_PATH_PATTERN
 
 logger = setup_logger(__name__)
 
-# Create router
+# Create router. Engine calls do blocking S3 and SQLite I/O, so handlers
+# run them in the default threadpool via asyncio.to_thread.
 router = APIRouter(prefix="/api/v1", tags=["metadata"])
 
-# Global engine instance (can be dependency injected in production)
-_engine: Optional[MetadataDiscoveryEngine] = None
+# GET responses carry a weak ETag; clients revalidate with If-None-Match on
+# every request and get an empty 304 if the table is unchanged
+CACHE_CONTROL = "no-cache"
+
+
+def get_engine(request: Request) -> MetadataDiscoveryEngine:
+    """Return the engine created by the application lifespan handler."""
+    return request.app.state.engine
+
+
+def _etag(*parts: object) -> str:
+    """Build a weak ETag from the values that determine a response."""
+    digest = hashlib.md5("\x1f".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _check_not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Apply HTTP caching headers for a GET response.
+    
+    Returns:
+        A 304 response if the client's cached copy matches etag, otherwise
+        None after setting ETag and Cache-Control on response
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def _to_column_responses(metadata: TableMetadata) -> List[ColumnResponse]:
+    """Convert a table's columns to response models."""
+    return [
+        ColumnResponse(
+            name=col.name,
+            data_type=col.data_type,
+            nullable=col.nullable,
+            comment=col.comment
+        )
+        for col in metadata.columns
+    ]
 
 
-def get_engine() -> MetadataDiscoveryEngine:
-    """Get or create the metadata discovery engine."""
-    global _engine
-    if _engine is None:
-        _engine = MetadataDiscoveryEngine(db_path="metadata.db")
-    return _engine
+def _to_table_response(metadata: TableMetadata) -> TableMetadataResponse:
+    """Convert internal TableMetadata to the API response model."""
+    return TableMetadataResponse(
+        table_name=metadata.table_name,
+        format=metadata.format,
+        location=metadata.location,
+        columns=_to_column_responses(metadata),
+        partitions=metadata.partitions,
+        properties=metadata.properties,
+        supports_time_travel=metadata.supports_time_travel,
+        created_at=metadata.created_at,
+        updated_at=metadata.updated_at,
+        num_files=metadata.num_files,
+        size_bytes=metadata.size_bytes,
+        row_count=metadata.row_count
+    )
 
 
 @router.post("/discover", response_model=DiscoverTableResponse, summary="Discover table metadata")
-async def discover_table(request: DiscoverTableRequest):
+async def discover_table(
+    request: DiscoverTableRequest,
+    http_request: Request,
+    engine: MetadataDiscoveryEngine = Depends(get_engine)
+):
     """
     Discover and store table metadata from S3.
     
@@ -58,37 +118,22 @@ async def discover_table(request: DiscoverTableRequest):
     **Returns:**
     - Discovered and normalized table metadata
     """
+    # Reject malformed paths before spending any S3 requests on them, with
+    # the same response format detection gives them
+    if S3_PATH_PATTERN.fullmatch(request.s3_path) is None:
+        message = f"Invalid S3 path format: {request.s3_path}. Expected format: s3://bucket/prefix"
+        logger.error("Format detection failed: %s", message)
+        raise HTTPException(status_code=400, detail={
+            "error": "Format detection failed",
+            "message": message,
+            "details": {}
+        })
+    
     try:
-        logger.info(f"API: Discovering table at {request.s3_path}")
-        
-        engine = get_engine()
-        metadata = engine.discover_and_store(request.s3_path)
-        
-        # Convert to response model
-        columns_response = [
-            ColumnResponse(
-                name=col.name,
-                data_type=col.data_type,
-                nullable=col.nullable,
-                comment=col.comment
-            )
-            for col in metadata.columns
-        ]
+        metadata = await asyncio.to_thread(engine.discover_and_store, request.s3_path)
+        http_request.state.table_format = metadata.format
         
-        table_response = TableMetadataResponse(
-            table_name=metadata.table_name,
-            format=metadata.format,
-            location=metadata.location,
-            columns=columns_response,
-            partitions=metadata.partitions,
-            properties=metadata.properties,
-            supports_time_travel=metadata.supports_time_travel,
-            created_at=metadata.created_at,
-            updated_at=metadata.updated_at,
-            num_files=metadata.num_files,
-            size_bytes=metadata.size_bytes,
-            row_count=metadata.row_count
-        )
+        table_response = _to_table_response(metadata)
         
         return DiscoverTableResponse(
             success=True,
@@ -97,35 +142,35 @@ async def discover_table(request: DiscoverTableRequest):
         )
         
     except FormatDetectionError as e:
-        logger.error(f"Format detection failed: {e.message}")
+        logger.error("Format detection failed: %s", e.message)
         raise HTTPException(status_code=400, detail={
             "error": "Format detection failed",
             "message": e.message,
             "details": e.details
         })
     except MetadataReadError as e:
-        logger.error(f"Metadata read failed: {e.message}")
+        logger.error("Metadata read failed: %s", e.message)
         raise HTTPException(status_code=500, detail={
             "error": "Metadata read failed",
             "message": e.message,
             "details": e.details
         })
     except NormalizationError as e:
-        logger.error(f"Normalization failed: {e.message}")
+        logger.error("Normalization failed: %s", e.message)
         raise HTTPException(status_code=500, detail={
             "error": "Normalization failed",
             "message": e.message,
             "details": e.details
         })
     except StorageError as e:
-        logger.error(f"Storage failed: {e.message}")
+        logger.error("Storage failed: %s", e.message)
         raise HTTPException(status_code=500, detail={
             "error": "Storage failed",
             "message": e.message,
             "details": e.details
         })
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         raise HTTPException(status_code=500, detail={
             "error": "Internal server error",
             "message": str(e)
@@ -134,22 +179,48 @@ async def discover_table(request: DiscoverTableRequest):
 
 @router.get("/tables", response_model=ListTablesResponse, summary="List all tables")
 async def list_tables(
-    format: Optional[str] = Query(None, description="Filter by format (ICEBERG, DELTA, HUDI)")
+    request: Request,
+    response: Response,
+    format: Optional[str] = Query(None, description="Filter by format (ICEBERG, DELTA, HUDI)"),
+    include_metadata: bool = Query(False, description="Include full metadata for every table"),
+    engine: MetadataDiscoveryEngine = Depends(get_engine)
 ):
     """
     List all tables in the metadata store.
     
     **Parameters:**
     - **format** (optional): Filter tables by format (ICEBERG, DELTA, or HUDI)
+    - **include_metadata** (optional): Also return full metadata for each table,
+      fetched in one query instead of a follow-up request per table
     
     **Returns:**
-    - List of table names
+    - List of table names, plus their metadata when requested
+    - 304 Not Modified when If-None-Match matches the current ETag
     """
     try:
-        logger.info(f"API: Listing tables (format={format})")
+        if include_metadata:
+            tables_metadata = await asyncio.to_thread(
+                engine.list_tables_with_metadata, format_filter=format
+            )
+            etag = _etag(format, *(
+                f"{metadata.table_name}@{metadata.updated_at}" for metadata in tables_metadata
+            ))
+            not_modified = _check_not_modified(request, response, etag)
+            if not_modified:
+                return not_modified
+            
+            return ListTablesResponse(
+                success=True,
+                count=len(tables_metadata),
+                tables=[metadata.table_name for metadata in tables_metadata],
+                table_metadata=[_to_table_response(metadata) for metadata in tables_metadata]
+            )
         
-        engine = get_engine()
-        tables = engine.list_tables(format_filter=format)
+        tables = await asyncio.to_thread(engine.list_tables, format_filter=format)
+        
+        not_modified = _check_not_modified(request, response, _etag(format, *tables))
+        if not_modified:
+            return not_modified
         
         return ListTablesResponse(
             success=True,
@@ -158,7 +229,7 @@ async def list_tables(
         )
         
     except Exception as e:
-        logger.error(f"Failed to list tables: {str(e)}")
+        logger.error("Failed to list tables: %s", e)
         raise HTTPException(status_code=500, detail={
             "error": "Failed to list tables",
             "message": str(e)
@@ -167,7 +238,10 @@ async def list_tables(
 
 @router.get("/tables/{table_name}", response_model=GetTableResponse, summary="Get table metadata")
 async def get_table(
-    table_name: str = Path(..., description="Name of the table")
+    request: Request,
+    response: Response,
+    table_name: str = Path(..., description="Name of the table"),
+    engine: MetadataDiscoveryEngine = Depends(get_engine)
 ):
     """
     Get detailed metadata for a specific table.
@@ -177,12 +251,10 @@ async def get_table(
     
     **Returns:**
     - Complete table metadata including columns, partitions, and properties
+    - 304 Not Modified when If-None-Match matches the current ETag
     """
     try:
-        logger.info(f"API: Getting table metadata for {table_name}")
-        
-        engine = get_engine()
-        metadata = engine.get_table_metadata(table_name)
+        metadata = await asyncio.to_thread(engine.get_table_metadata, table_name)
         
         if metadata is None:
             raise HTTPException(status_code=404, detail={
@@ -190,31 +262,12 @@ async def get_table(
                 "message": f"Table '{table_name}' does not exist in the metadata store"
             })
         
-        # Convert to response model
-        columns_response = [
-            ColumnResponse(
-                name=col.name,
-                data_type=col.data_type,
-                nullable=col.nullable,
-                comment=col.comment
-            )
-            for col in metadata.columns
-        ]
+        etag = _etag(metadata.table_name, metadata.updated_at)
+        not_modified = _check_not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
         
-        table_response = TableMetadataResponse(
-            table_name=metadata.table_name,
-            format=metadata.format,
-            location=metadata.location,
-            columns=columns_response,
-            partitions=metadata.partitions,
-            properties=metadata.properties,
-            supports_time_travel=metadata.supports_time_travel,
-            created_at=metadata.created_at,
-            updated_at=metadata.updated_at,
-            num_files=metadata.num_files,
-            size_bytes=metadata.size_bytes,
-            row_count=metadata.row_count
-        )
+        table_response = _to_table_response(metadata)
         
         return GetTableResponse(
             success=True,
@@ -224,7 +277,7 @@ async def get_table(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get table metadata: {str(e)}")
+        logger.error("Failed to get table metadata: %s", e)
         raise HTTPException(status_code=500, detail={
             "error": "Failed to retrieve table metadata",
             "message": str(e)
@@ -233,7 +286,8 @@ async def get_table(
 
 @router.delete("/tables/{table_name}", response_model=DeleteTableResponse, summary="Delete table metadata")
 async def delete_table(
-    table_name: str = Path(..., description="Name of the table to delete")
+    table_name: str = Path(..., description="Name of the table to delete"),
+    engine: MetadataDiscoveryEngine = Depends(get_engine)
 ):
     """
     Delete table metadata from the store.
@@ -245,10 +299,7 @@ async def delete_table(
     - Success confirmation
     """
     try:
-        logger.info(f"API: Deleting table metadata for {table_name}")
-        
-        engine = get_engine()
-        deleted = engine.delete_table(table_name)
+        deleted = await asyncio.to_thread(engine.delete_table, table_name)
         
         if not deleted:
             raise HTTPException(status_code=404, detail={
@@ -264,7 +315,7 @@ async def delete_table(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete table metadata: {str(e)}")
+        logger.error("Failed to delete table metadata: %s", e)
         raise HTTPException(status_code=500, detail={
             "error": "Failed to delete table metadata",
             "message": str(e)
@@ -273,7 +324,10 @@ async def delete_table(
 
 @router.get("/tables/{table_name}/columns", response_model=List[ColumnResponse], summary="Get table columns")
 async def get_table_columns(
-    table_name: str = Path(..., description="Name of the table")
+    request: Request,
+    response: Response,
+    table_name: str = Path(..., description="Name of the table"),
+    engine: MetadataDiscoveryEngine = Depends(get_engine)
 ):
     """
     Get column definitions for a specific table.
@@ -283,12 +337,10 @@ async def get_table_columns(
     
     **Returns:**
     - List of column definitions
+    - 304 Not Modified when If-None-Match matches the current ETag
     """
     try:
-        logger.info(f"API: Getting columns for table {table_name}")
-        
-        engine = get_engine()
-        metadata = engine.get_table_metadata(table_name)
+        metadata = await asyncio.to_thread(engine.get_table_metadata, table_name)
         
         if metadata is None:
             raise HTTPException(status_code=404, detail={
@@ -296,22 +348,17 @@ async def get_table_columns(
                 "message": f"Table '{table_name}' does not exist in the metadata store"
             })
         
-        columns_response = [
-            ColumnResponse(
-                name=col.name,
-                data_type=col.data_type,
-                nullable=col.nullable,
-                comment=col.comment
-            )
-            for col in metadata.columns
-        ]
+        etag = _etag(metadata.table_name, metadata.updated_at)
+        not_modified = _check_not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
         
-        return columns_response
+        return _to_column_responses(metadata)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get table columns: {str(e)}")
+        logger.error("Failed to get table columns: %s", e)
         raise HTTPException(status_code=500, detail={
             "error": "Failed to retrieve table columns",
             "message": str(e)
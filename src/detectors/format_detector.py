@@ -5,23 +5,42 @@ Detects whether an S3 path contains Iceberg, Delta Lake, or Hudi tables
 by examining directory structure and metadata files.
 """
 
-import boto3
-from enum import Enum
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 
+from ..models.table_metadata import TableFormat
 from ..utils.logger import setup_logger
+from ..utils.s3_utils import get_s3_client, parse_table_path
 from ..utils.exceptions import FormatDetectionError
 
 logger = setup_logger(__name__)
 
 
-class TableFormat(str, Enum):
-    """Supported table formats."""
-    ICEBERG = "ICEBERG"
-    DELTA = "DELTA"
-    HUDI = "HUDI"
-    UNKNOWN = "UNKNOWN"
+# Marker directory for each format, in detection priority order
+FORMAT_MARKERS = (
+    ("metadata/", TableFormat.ICEBERG),
+    ("_delta_log/", TableFormat.DELTA),
+    (".hoodie/", TableFormat.HUDI),
+)
+
+# Well-known object each format writes at creation time. These are only
+# HEADed when the table-root listing cannot settle the format on its own:
+# the listing was truncated, or more than one marker directory exists.
+FORMAT_SENTINELS = (
+    ("metadata/version-hint.text", TableFormat.ICEBERG),
+    ("_delta_log/00000000000000000000.json", TableFormat.DELTA),
+    (".hoodie/hoodie.properties", TableFormat.HUDI),
+)
+
+# A table's format practically never changes, so detection results are
+# kept in a bounded LRU for a few minutes
+FORMAT_CACHE_MAXSIZE = 10_000
+FORMAT_CACHE_TTL_SECONDS = 300.0
 
 
 class FormatDetector:
@@ -36,7 +55,8 @@ class FormatDetector:
     
     def __init__(self, aws_access_key_id: Optional[str] = None, 
                  aws_secret_access_key: Optional[str] = None,
-                 region_name: str = "us-east-1"):
+                 region_name: str = "us-east-1",
+                 s3_client: Optional[BaseClient] = None):
         """
         Initialize the format detector.
         
@@ -44,14 +64,17 @@ class FormatDetector:
             aws_access_key_id: AWS access key (optional, uses env vars if not provided)
             aws_secret_access_key: AWS secret key (optional, uses env vars if not provided)
             region_name: AWS region name
+            s3_client: Existing S3 client to use instead of looking one up
+                from the credentials (lets callers share one connection pool)
         """
-        self.s3_client = boto3.client(
-            's3',
+        self.s3_client = s3_client or get_s3_client(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name
         )
-        logger.info("FormatDetector initialized")
+        self._format_cache: OrderedDict = OrderedDict()
+        self._format_cache_lock = threading.Lock()
+        logger.debug("FormatDetector initialized")
     
     def detect_format(self, s3_path: str) -> TableFormat:
         """
@@ -66,23 +89,45 @@ class FormatDetector:
         Raises:
             FormatDetectionError: If format cannot be detected or S3 access fails
         """
-        logger.info(f"Detecting format for: {s3_path}")
-        
         try:
             bucket, prefix = self._parse_s3_path(s3_path)
             
-            # Check for format-specific directories
-            if self._check_directory_exists(bucket, prefix, "metadata/"):
-                logger.info(f"Detected ICEBERG format at {s3_path}")
-                return TableFormat.ICEBERG
+            cached = self._get_cached_format(bucket, prefix)
+            if cached is not None:
+                logger.debug("Detected %s format at %s (cached)", cached.value, s3_path)
+                return cached
             
-            if self._check_directory_exists(bucket, prefix, "_delta_log/"):
-                logger.info(f"Detected DELTA format at {s3_path}")
-                return TableFormat.DELTA
+            # One delimited listing returns every sub-directory of the table
+            # root, so all three markers are checked in a single round-trip
+            subdirs = self._list_subdirectories(bucket, prefix)
+            
+            if subdirs is None:
+                candidates = [table_format for _, table_format in FORMAT_MARKERS]
+            else:
+                candidates = [
+                    table_format for directory, table_format in FORMAT_MARKERS
+                    if f"{prefix}{directory}" in subdirs
+                ]
             
-            if self._check_directory_exists(bucket, prefix, ".hoodie/"):
-                logger.info(f"Detected HUDI format at {s3_path}")
-                return TableFormat.HUDI
+            table_format = None
+            if subdirs is not None and len(candidates) == 1:
+                table_format = candidates[0]
+            elif candidates:
+                # Truncated or ambiguous listing: let the sentinel files decide
+                table_format = self._probe_sentinels(bucket, prefix, candidates)
+                if table_format is None and subdirs is not None:
+                    table_format = candidates[0]
+            
+            if table_format is None and subdirs is None:
+                for directory, marker_format in FORMAT_MARKERS:
+                    if self._check_directory_exists(bucket, prefix, directory):
+                        table_format = marker_format
+                        break
+            
+            if table_format is not None:
+                logger.debug("Detected %s format at %s", table_format.value, s3_path)
+                self._cache_format(bucket, prefix, table_format)
+                return table_format
             
             raise FormatDetectionError(
                 f"No recognized table format found at {s3_path}",
@@ -101,6 +146,45 @@ class FormatDetector:
                 details={"path": s3_path, "error": str(e)}
             )
     
+    def _get_cached_format(self, bucket: str, prefix: str) -> Optional[TableFormat]:
+        """
+        Look up a previously detected format.
+        
+        Args:
+            bucket: S3 bucket name
+            prefix: S3 prefix (table path)
+            
+        Returns:
+            Cached TableFormat, or None if absent or expired
+        """
+        key = (bucket, prefix)
+        with self._format_cache_lock:
+            entry = self._format_cache.get(key)
+            if entry is None:
+                return None
+            table_format, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._format_cache[key]
+                return None
+            self._format_cache.move_to_end(key)
+            return table_format
+    
+    def _cache_format(self, bucket: str, prefix: str, table_format: TableFormat) -> None:
+        """
+        Remember a detected format, evicting the least recently used entry when full.
+        
+        Args:
+            bucket: S3 bucket name
+            prefix: S3 prefix (table path)
+            table_format: Detected format
+        """
+        expires_at = time.monotonic() + FORMAT_CACHE_TTL_SECONDS
+        with self._format_cache_lock:
+            self._format_cache[(bucket, prefix)] = (table_format, expires_at)
+            self._format_cache.move_to_end((bucket, prefix))
+            if len(self._format_cache) > FORMAT_CACHE_MAXSIZE:
+                self._format_cache.popitem(last=False)
+    
     def _parse_s3_path(self, s3_path: str) -> tuple[str, str]:
         """
         Parse S3 path into bucket and prefix.
@@ -114,20 +198,116 @@ class FormatDetector:
         Raises:
             FormatDetectionError: If path format is invalid
         """
-        if not s3_path.startswith("s3://"):
+        parsed = parse_table_path(s3_path)
+        if parsed is None:
             raise FormatDetectionError(
                 f"Invalid S3 path format: {s3_path}. Expected format: s3://bucket/prefix"
             )
+        return parsed
+    
+    def _probe_sentinels(self, bucket: str, prefix: str,
+                         candidates: Iterable[TableFormat]) -> Optional[TableFormat]:
+        """
+        HEAD the sentinel file of each candidate format concurrently.
+        
+        Args:
+            bucket: S3 bucket name
+            prefix: S3 prefix (table path)
+            candidates: Formats to probe
+            
+        Returns:
+            The highest-priority candidate whose sentinel exists, or None
+        """
+        sentinels = [
+            (f"{prefix}{sentinel}", table_format)
+            for sentinel, table_format in FORMAT_SENTINELS
+            if table_format in candidates
+        ]
+        with ThreadPoolExecutor(max_workers=len(sentinels) or 1) as executor:
+            found = list(executor.map(
+                lambda entry: self._object_exists(bucket, entry[0]), sentinels
+            ))
+        for (_, table_format), exists in zip(sentinels, found):
+            if exists:
+                return table_format
+        return None
+    
+    def _object_exists(self, bucket: str, key: str) -> bool:
+        """
+        Check whether a single object exists with a HEAD request.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Full object key
+            
+        Returns:
+            True if the object exists. A 404 is a miss, and so is a 403,
+            which S3 returns for missing keys when the caller lacks
+            s3:ListBucket; the listing fallback reports real access errors.
+        """
+        try:
+            self.s3_client.head_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', '403', 'AccessDenied'):
+                return False
+            raise self._client_error(e, bucket, key)
+    
+    def _list_subdirectories(self, bucket: str, prefix: str) -> Optional[set]:
+        """
+        List the immediate sub-directories of the given S3 prefix.
+        
+        Args:
+            bucket: S3 bucket name
+            prefix: S3 prefix (table path)
+            
+        Returns:
+            Set of full sub-directory prefixes (e.g., "table/metadata/"), or
+            None if the listing was truncated and the caller should probe
+            each directory individually
+        """
+        try:
+            response = self.s3_client.list_objects_v2(
+                Bucket=bucket,
+                Prefix=prefix,
+                Delimiter='/'
+            )
+        except ClientError as e:
+            raise self._client_error(e, bucket, prefix)
         
-        path_parts = s3_path.replace("s3://", "").split("/", 1)
-        bucket = path_parts[0]
-        prefix = path_parts[1] if len(path_parts) > 1 else ""
+        if response.get('IsTruncated'):
+            return None
         
-        # Ensure prefix ends with / for consistent directory checking
-        if prefix and not prefix.endswith("/"):
-            prefix += "/"
+        return {cp['Prefix'] for cp in response.get('CommonPrefixes', [])}
+    
+    def _client_error(self, error: ClientError, bucket: str,
+                      prefix: str) -> FormatDetectionError:
+        """
+        Translate an S3 ClientError into a FormatDetectionError.
         
-        return bucket, prefix
+        Args:
+            error: The botocore ClientError
+            bucket: S3 bucket name
+            prefix: S3 prefix being listed
+            
+        Returns:
+            FormatDetectionError describing the failure
+        """
+        error_code = error.response['Error']['Code']
+        if error_code == 'NoSuchBucket':
+            return FormatDetectionError(
+                f"S3 bucket does not exist: {bucket}",
+                details={"bucket": bucket, "error_code": error_code}
+            )
+        if error_code == 'AccessDenied':
+            return FormatDetectionError(
+                f"Access denied to S3 bucket: {bucket}",
+                details={"bucket": bucket, "error_code": error_code}
+            )
+        return FormatDetectionError(
+            f"S3 error while checking directory: {str(error)}",
+            details={"bucket": bucket, "prefix": prefix, "error": str(error)}
+        )
     
     def _check_directory_exists(self, bucket: str, prefix: str, 
                                directory: str) -> bool:
@@ -148,35 +328,19 @@ class FormatDetector:
             response = self.s3_client.list_objects_v2(
                 Bucket=bucket,
                 Prefix=full_prefix,
-                MaxKeys=1
+                MaxKeys=1,
+                FetchOwner=False
             )
             
             # If any objects exist with this prefix, directory exists
-            exists = 'Contents' in response and len(response['Contents']) > 0
+            exists = response.get('KeyCount', 0) > 0
             
-            logger.debug(
-                f"Directory check: {directory} at s3://{bucket}/{prefix} = {exists}"
-            )
+            logger.debug("Directory check: %s at s3://%s/%s = %s", directory, bucket, prefix, exists)
             
             return exists
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'NoSuchBucket':
-                raise FormatDetectionError(
-                    f"S3 bucket does not exist: {bucket}",
-                    details={"bucket": bucket, "error_code": error_code}
-                )
-            elif error_code == 'AccessDenied':
-                raise FormatDetectionError(
-                    f"Access denied to S3 bucket: {bucket}",
-                    details={"bucket": bucket, "error_code": error_code}
-                )
-            else:
-                raise FormatDetectionError(
-                    f"S3 error while checking directory: {str(e)}",
-                    details={"bucket": bucket, "prefix": prefix, "error": str(e)}
-                )
+            raise self._client_error(e, bucket, prefix)
         except Exception as e:
-            logger.error(f"Unexpected error checking directory: {str(e)}")
+            logger.error("Unexpected error checking directory: %s", e)
             return False
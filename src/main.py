@@ -6,16 +6,16 @@ format detection, metadata reading, normalization, and storage.
 """
 
 import sys
-from typing import Optional
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Union
 
-from .detectors.format_detector import FormatDetector, TableFormat
-from .readers.iceberg_reader import IcebergReader
-from .readers.delta_reader import DeltaReader
-from .readers.hudi_reader import HudiReader
+from .detectors.format_detector import FormatDetector
 from .normalizer.metadata_normalizer import MetadataNormalizer
 from .storage.metadata_store import MetadataStore
-from .models.table_metadata import TableMetadata
+from .models.table_metadata import TableMetadata, TableFormat
 from .utils.logger import setup_logger
+from .utils.s3_utils import get_s3_client
 from .utils.exceptions import (
     PlatformException,
     FormatDetectionError,
@@ -24,6 +24,10 @@ from .utils.exceptions import (
     StorageError
 )
 
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+    from .readers import IcebergReader, DeltaReader, HudiReader
+
 logger = setup_logger(__name__)
 
 
@@ -38,12 +42,21 @@ class MetadataDiscoveryEngine:
     4. Store in metadata database
     """
     
+    # Reader for each format, by attribute name so readers stay lazy
+    READER_ATTRIBUTES = {
+        TableFormat.ICEBERG: "iceberg_reader",
+        TableFormat.DELTA: "delta_reader",
+        TableFormat.HUDI: "hudi_reader",
+    }
+    
     def __init__(
         self,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         region_name: str = "us-east-1",
-        db_path: str = "metadata.db"
+        db_path: str = "metadata.db",
+        db_pragmas: Optional[Mapping[str, Union[str, int]]] = None,
+        max_workers: int = 16
     ):
         """
         Initialize the metadata discovery engine.
@@ -53,39 +66,54 @@ class MetadataDiscoveryEngine:
             aws_secret_access_key: AWS secret key (optional)
             region_name: AWS region
             db_path: Path to SQLite database
+            db_pragmas: SQLite PRAGMAs applied on each database connection
+            max_workers: Default number of tables discovered concurrently by
+                discover_and_store_many
         """
         logger.info("Initializing MetadataDiscoveryEngine")
         
-        # Initialize components
-        self.format_detector = FormatDetector(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
-        
-        self.iceberg_reader = IcebergReader(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
-        
-        self.delta_reader = DeltaReader(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
-        
-        self.hudi_reader = HudiReader(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
+        # S3-backed components are created on first use (see the properties
+        # below), so list/get/delete never build an S3 client
+        self._aws_options = {
+            "aws_access_key_id": aws_access_key_id,
+            "aws_secret_access_key": aws_secret_access_key,
+            "region_name": region_name,
+        }
         
         self.normalizer = MetadataNormalizer()
-        self.metadata_store = MetadataStore(db_path=db_path)
+        self.metadata_store = MetadataStore(db_path=db_path, pragmas=db_pragmas)
+        self.max_workers = max_workers
         
         logger.info("MetadataDiscoveryEngine initialized successfully")
     
+    @cached_property
+    def s3_client(self) -> "BaseClient":
+        """S3 client (and connection pool) shared by the detector and readers."""
+        return get_s3_client(**self._aws_options)
+    
+    @cached_property
+    def format_detector(self) -> FormatDetector:
+        """Format detector, created on first use."""
+        return FormatDetector(**self._aws_options, s3_client=self.s3_client)
+    
+    @cached_property
+    def iceberg_reader(self) -> "IcebergReader":
+        """Iceberg reader, created (and its module imported) on first use."""
+        from .readers import IcebergReader
+        return IcebergReader(**self._aws_options, s3_client=self.s3_client)
+    
+    @cached_property
+    def delta_reader(self) -> "DeltaReader":
+        """Delta Lake reader, created (and its module imported) on first use."""
+        from .readers import DeltaReader
+        return DeltaReader(**self._aws_options, s3_client=self.s3_client)
+    
+    @cached_property
+    def hudi_reader(self) -> "HudiReader":
+        """Hudi reader, created (and its module imported) on first use."""
+        from .readers import HudiReader
+        return HudiReader(**self._aws_options, s3_client=self.s3_client)
+    
     def discover_and_store(self, s3_path: str) -> TableMetadata:
         """
         Complete metadata discovery workflow.
@@ -99,38 +127,113 @@ class MetadataDiscoveryEngine:
         Raises:
             PlatformException: If any step fails
         """
-        logger.info(f"Starting metadata discovery for: {s3_path}")
+        normalized_metadata = self._discover(s3_path)
+        
+        try:
+            # Step 4: Store in database
+            table_id = self.metadata_store.save_table_metadata(normalized_metadata)
+            logger.debug("Stored metadata in database (table_id=%s)", table_id)
+        except StorageError as e:
+            logger.error("Metadata discovery failed: %s", e.message)
+            raise
+        
+        logger.debug("Successfully completed metadata discovery for: %s", normalized_metadata.table_name)
+        return normalized_metadata
+    
+    def _discover(self, s3_path: str) -> TableMetadata:
+        """
+        Detect, read and normalize a table's metadata without storing it.
+        
+        Args:
+            s3_path: S3 path to the table
+            
+        Returns:
+            Normalized TableMetadata
+            
+        Raises:
+            PlatformException: If any step fails
+        """
+        logger.debug("Starting metadata discovery for: %s", s3_path)
         
         try:
             # Step 1: Detect format
             table_format = self.format_detector.detect_format(s3_path)
-            logger.info(f"Detected format: {table_format}")
+            logger.debug("Detected format: %s", table_format)
             
             # Step 2: Read format-specific metadata
             raw_metadata = self._read_metadata(s3_path, table_format)
-            logger.info(f"Read raw metadata from {table_format} table")
+            logger.debug("Read raw metadata from %s table", table_format)
             
             # Step 3: Normalize to unified schema
-            normalized_metadata = self.normalizer.normalize(raw_metadata, table_format.value)
-            logger.info(f"Normalized metadata to unified schema")
+            normalized_metadata = self.normalizer.normalize(raw_metadata, table_format)
+            logger.debug("Normalized metadata to unified schema")
             
-            # Step 4: Store in database
-            table_id = self.metadata_store.save_table_metadata(normalized_metadata)
-            logger.info(f"Stored metadata in database (table_id={table_id})")
-            
-            logger.info(f"Successfully completed metadata discovery for: {normalized_metadata.table_name}")
             return normalized_metadata
             
-        except (FormatDetectionError, MetadataReadError, NormalizationError, StorageError) as e:
-            logger.error(f"Metadata discovery failed: {e.message}")
+        except (FormatDetectionError, MetadataReadError, NormalizationError) as e:
+            logger.error("Metadata discovery failed: %s", e.message)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during metadata discovery: {str(e)}")
+            logger.error("Unexpected error during metadata discovery: %s", e)
             raise PlatformException(
                 f"Metadata discovery failed: {str(e)}",
                 details={"s3_path": s3_path, "error": str(e)}
             )
     
+    def discover_and_store_many(self, s3_paths: List[str],
+                                max_workers: Optional[int] = None) -> List[TableMetadata]:
+        """
+        Run the discovery workflow for several tables concurrently.
+        
+        Discovery is dominated by S3 round-trips, so tables are processed on
+        a thread pool. The tables that were discovered are then stored
+        together in a single transaction, even if others failed.
+        
+        Args:
+            s3_paths: S3 paths of the tables
+            max_workers: Number of concurrent discoveries (defaults to the
+                engine's max_workers)
+            
+        Returns:
+            Normalized and stored TableMetadata, in the order of s3_paths
+            
+        Raises:
+            PlatformException: If any table fails; details map each failed
+                path to its error and list the tables that succeeded
+            StorageError: If storing the discovered tables fails
+        """
+        workers = min(max_workers or self.max_workers, len(s3_paths)) or 1
+        results: Dict[str, TableMetadata] = {}
+        failures: Dict[str, str] = {}
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._discover, s3_path): s3_path
+                for s3_path in s3_paths
+            }
+            for future in as_completed(futures):
+                s3_path = futures[future]
+                try:
+                    results[s3_path] = future.result()
+                except PlatformException as e:
+                    failures[s3_path] = e.message
+        
+        discovered = [results[path] for path in s3_paths if path in results]
+        if discovered:
+            self.metadata_store.save_table_metadata_many(discovered)
+            logger.debug("Stored metadata for %d table(s) in one transaction", len(discovered))
+        
+        if failures:
+            raise PlatformException(
+                f"Metadata discovery failed for {len(failures)} of {len(s3_paths)} tables",
+                details={
+                    "failures": failures,
+                    "succeeded": [metadata.table_name for metadata in discovered]
+                }
+            )
+        
+        return [results[s3_path] for s3_path in s3_paths]
+    
     def _read_metadata(self, s3_path: str, table_format: TableFormat) -> dict:
         """
         Read metadata using appropriate reader based on format.
@@ -142,17 +245,13 @@ class MetadataDiscoveryEngine:
         Returns:
             Raw metadata dictionary
         """
-        if table_format == TableFormat.ICEBERG:
-            return self.iceberg_reader.read_metadata(s3_path)
-        elif table_format == TableFormat.DELTA:
-            return self.delta_reader.read_metadata(s3_path)
-        elif table_format == TableFormat.HUDI:
-            return self.hudi_reader.read_metadata(s3_path)
-        else:
+        reader_attribute = self.READER_ATTRIBUTES.get(table_format)
+        if reader_attribute is None:
             raise MetadataReadError(
                 f"Unsupported table format: {table_format}",
                 details={"format": table_format}
             )
+        return getattr(self, reader_attribute).read_metadata(s3_path)
     
     def get_table_metadata(self, table_name: str) -> Optional[TableMetadata]:
         """
@@ -178,6 +277,18 @@ class MetadataDiscoveryEngine:
         """
         return self.metadata_store.list_tables(format_filter=format_filter)
     
+    def list_tables_with_metadata(self, format_filter: Optional[str] = None) -> list[TableMetadata]:
+        """
+        List full metadata for all stored tables.
+        
+        Args:
+            format_filter: Optional format filter (ICEBERG, DELTA, HUDI)
+            
+        Returns:
+            List of TableMetadata objects
+        """
+        return self.metadata_store.list_tables_with_metadata(format_filter=format_filter)
+    
     def delete_table(self, table_name: str) -> bool:
         """
         Delete stored table metadata.
@@ -189,6 +300,10 @@ class MetadataDiscoveryEngine:
             True if deleted, False if not found
         """
         return self.metadata_store.delete_table_metadata(table_name)
+    
+    def close(self) -> None:
+        """Release the metadata store's database connections."""
+        self.metadata_store.close()
 
 
 def main():
@@ -197,10 +312,12 @@ def main():
     
     Usage examples:
         python -m src.main discover s3://bucket/warehouse/table
+        python -m src.main discover s3://bucket/wh/t1 s3://bucket/wh/t2 --parallelism 8
         python -m src.main list
         python -m src.main get table_name
     """
     import argparse
+    from config.settings import get_config
     
     parser = argparse.ArgumentParser(
         description="Unified Data Access Platform - Metadata Discovery Engine"
@@ -210,7 +327,9 @@ def main():
     
     # Discover command
     discover_parser = subparsers.add_parser("discover", help="Discover and store table metadata")
-    discover_parser.add_argument("s3_path", help="S3 path to the table")
+    discover_parser.add_argument("s3_paths", nargs="+", metavar="s3_path", help="S3 path(s) to the table(s)")
+    discover_parser.add_argument("--parallelism", type=int, default=16,
+                                 help="Number of tables discovered concurrently")
     discover_parser.add_argument("--db-path", default="metadata.db", help="Database path")
     
     # List command
@@ -222,6 +341,7 @@ def main():
     get_parser = subparsers.add_parser("get", help="Get table metadata")
     get_parser.add_argument("table_name", help="Name of the table")
     get_parser.add_argument("--db-path", default="metadata.db", help="Database path")
+    get_parser.add_argument("--json", action="store_true", help="Print the metadata as JSON")
     
     args = parser.parse_args()
     
@@ -230,15 +350,24 @@ def main():
         sys.exit(1)
     
     try:
-        engine = MetadataDiscoveryEngine(db_path=args.db_path)
+        engine = MetadataDiscoveryEngine(
+            db_path=args.db_path,
+            db_pragmas=get_config().database.pragmas,
+        )
         
         if args.command == "discover":
-            metadata = engine.discover_and_store(args.s3_path)
-            print(f"\n✓ Successfully discovered metadata for: {metadata.table_name}")
-            print(f"  Format: {metadata.format}")
-            print(f"  Columns: {len(metadata.columns)}")
-            print(f"  Partitions: {len(metadata.partitions)}")
-            print(f"  Time Travel: {metadata.supports_time_travel}")
+            if len(args.s3_paths) == 1:
+                discovered = [engine.discover_and_store(args.s3_paths[0])]
+            else:
+                discovered = engine.discover_and_store_many(
+                    args.s3_paths, max_workers=args.parallelism
+                )
+            for metadata in discovered:
+                print(f"\n✓ Successfully discovered metadata for: {metadata.table_name}")
+                print(f"  Format: {metadata.format}")
+                print(f"  Columns: {len(metadata.columns)}")
+                print(f"  Partitions: {len(metadata.partitions)}")
+                print(f"  Time Travel: {metadata.supports_time_travel}")
             
         elif args.command == "list":
             tables = engine.list_tables(format_filter=args.format)
@@ -248,7 +377,9 @@ def main():
             
         elif args.command == "get":
             metadata = engine.get_table_metadata(args.table_name)
-            if metadata:
+            if metadata and args.json:
+                print(metadata.to_json().decode())
+            elif metadata:
                 print(f"\nTable: {metadata.table_name}")
                 print(f"Format: {metadata.format}")
                 print(f"Location: {metadata.location}")
@@ -1,5 +1,5 @@
 """Internal data models."""
 
-from .table_metadata import TableMetadata, ColumnMetadata
+from .table_metadata import TableMetadata, ColumnMetadata, TableFormat
 
-__all__ = ["TableMetadata", "ColumnMetadata"]
+__all__ = ["TableMetadata", "ColumnMetadata", "TableFormat"]
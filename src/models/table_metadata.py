@@ -5,20 +5,53 @@ These models are format-agnostic and serve as the normalized schema
 for all table formats (Iceberg, Delta, Hudi).
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from enum import Enum
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
+import orjson
 
-@dataclass
+
+class TableFormat(str, Enum):
+    """Supported table formats."""
+    ICEBERG = "ICEBERG"
+    DELTA = "DELTA"
+    HUDI = "HUDI"
+    UNKNOWN = "UNKNOWN"
+
+
+def _intern(value):
+    """
+    Intern a string so repeated values share one object.
+    
+    Formats, partition names, column names and types repeat across thousands
+    of tables during bulk discovery. Non-str values (None, str subclasses
+    such as enum members) are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True, frozen=True)
 class ColumnMetadata:
-    """Represents a single column in a table."""
+    """
+    Represents a single column in a table.
+    
+    Instances are immutable and hashable, so schemas can be compared with
+    set operations (e.g. set(old.columns) - set(new.columns)).
+    """
     
     name: str
     data_type: str
     nullable: bool = True
     comment: Optional[str] = None
     
+    def __post_init__(self):
+        # Frozen dataclass: assign through object.__setattr__
+        object.__setattr__(self, "name", _intern(self.name))
+        object.__setattr__(self, "data_type", _intern(self.data_type))
+    
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
         return {
@@ -39,7 +72,7 @@ class ColumnMetadata:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TableMetadata:
     """
     Unified metadata model for lakehouse tables.
@@ -63,6 +96,17 @@ class TableMetadata:
     size_bytes: Optional[int] = None
     row_count: Optional[int] = None
     
+    # Lazily built (columns list, column count, name -> column, names) used
+    # by the column lookup helpers; rebuilt when columns is replaced or resized
+    _column_index: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Accept any iterable of columns (e.g. a generator) and materialize once
+        if not isinstance(self.columns, list):
+            self.columns = list(self.columns)
+        self.format = _intern(self.format)
+        self.partitions = [_intern(name) for name in self.partitions]
+    
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
         return {
@@ -98,16 +142,43 @@ class TableMetadata:
             row_count=data.get("row_count")
         )
     
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON bytes.
+        
+        orjson encodes the dataclass (and nested columns) directly, producing
+        the same document as to_dict without building intermediate dicts.
+        """
+        return orjson.dumps(self, option=orjson.OPT_SERIALIZE_DATACLASS)
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "TableMetadata":
+        """Create TableMetadata from JSON produced by to_json."""
+        return cls.from_dict(orjson.loads(data))
+    
+    def _get_column_index(self) -> Tuple[Dict[str, ColumnMetadata], Tuple[str, ...]]:
+        """
+        Return the cached column lookup structures, rebuilding them if stale.
+        
+        The cache is keyed on the identity and length of the columns list,
+        so assigning a new list or appending/removing columns invalidates
+        it; replacing an element in place without resizing does not.
+        """
+        index = self._column_index
+        if index is None or index[0] is not self.columns or index[1] != len(self.columns):
+            by_name = {col.name: col for col in reversed(self.columns)}
+            names = tuple(col.name for col in self.columns)
+            index = (self.columns, len(self.columns), by_name, names)
+            self._column_index = index
+        return index[2], index[3]
+    
     def get_column_names(self) -> List[str]:
         """Get list of column names."""
-        return [col.name for col in self.columns]
+        return list(self._get_column_index()[1])
     
     def get_column_by_name(self, name: str) -> Optional[ColumnMetadata]:
         """Get column metadata by name."""
-        for col in self.columns:
-            if col.name == name:
-                return col
-        return None
+        return self._get_column_index()[0].get(name)
     
     def is_partitioned(self) -> bool:
         """Check if table is partitioned."""
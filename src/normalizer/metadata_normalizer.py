@@ -5,16 +5,50 @@ Converts format-specific metadata (Iceberg, Delta, Hudi) into the unified
 TableMetadata model for consistent internal representation.
 """
 
-from typing import Dict, List
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Union
 from datetime import datetime
 
-from ..models.table_metadata import TableMetadata, ColumnMetadata
+from ..models.table_metadata import TableMetadata, ColumnMetadata, TableFormat
 from ..utils.logger import setup_logger
 from ..utils.exceptions import NormalizationError
 
 logger = setup_logger(__name__)
 
 
+def _field_type(field: Dict):
+    """Return a schema field's type, unwrapping complex (struct, list, map) types."""
+    field_type = field.get("type", "string")
+    if isinstance(field_type, dict):
+        return field_type.get("type", "string")
+    return field_type
+
+
+def _hudi_field_type(field: Dict) -> Tuple[str, bool]:
+    """
+    Resolve a Hudi (Avro) field's type and nullability in one pass.
+    
+    A union such as ["null", "string"] resolves to its first non-null
+    member and is nullable; any other type is taken as is and nullable.
+    """
+    field_type = _field_type(field)
+    if isinstance(field_type, list):
+        non_null_types = [t for t in field_type if t != "null"]
+        return (
+            non_null_types[0] if non_null_types else "string",
+            len(non_null_types) != len(field_type)
+        )
+    return field_type, True
+
+
+@lru_cache(maxsize=4096)
+def _extract_table_name(s3_path: str) -> str:
+    """Return the last non-empty component of an S3 path."""
+    path = s3_path.removeprefix("s3://").removeprefix("s3a://").rstrip("/")
+    return path.rpartition("/")[2] or "unknown_table"
+
+
 class MetadataNormalizer:
     """
     Normalizes format-specific metadata into unified TableMetadata model.
@@ -72,13 +106,38 @@ class MetadataNormalizer:
         "timestamp": "TIMESTAMP",
     }
     
-    def normalize(self, raw_metadata: Dict, table_format: str) -> TableMetadata:
+    TYPE_MAPS = {
+        TableFormat.ICEBERG: ICEBERG_TYPE_MAP,
+        TableFormat.DELTA: DELTA_TYPE_MAP,
+        TableFormat.HUDI: HUDI_TYPE_MAP,
+    }
+    
+    # Distinct (type name, format) pairs remembered by _map_type
+    TYPE_CACHE_MAXSIZE = 4096
+    
+    # Splits "decimal(10,2)" into base type and parameter suffix in one match
+    _TYPE_RE = re.compile(r'^([^(]+)(\(.*\))?$')
+    
+    def __init__(self):
+        """Initialize the normalizer and its per-format dispatch table."""
+        self._dispatch = {
+            TableFormat.ICEBERG: self._normalize_iceberg,
+            TableFormat.DELTA: self._normalize_delta,
+            TableFormat.HUDI: self._normalize_hudi,
+        }
+        # Wide schemas repeat a handful of type strings, so each distinct
+        # type is parsed and mapped once instead of once per column
+        self._map_type = lru_cache(maxsize=self.TYPE_CACHE_MAXSIZE)(self._map_type)
+    
+    def normalize(self, raw_metadata: Dict,
+                  table_format: Union[TableFormat, str]) -> TableMetadata:
         """
         Normalize format-specific metadata to TableMetadata.
         
         Args:
             raw_metadata: Raw metadata dictionary from format-specific reader
-            table_format: Format type ("ICEBERG", "DELTA", "HUDI")
+            table_format: TableFormat member; the plain names ("ICEBERG",
+                "DELTA", "HUDI") are also accepted
             
         Returns:
             Normalized TableMetadata object
@@ -86,20 +145,21 @@ class MetadataNormalizer:
         Raises:
             NormalizationError: If normalization fails
         """
-        logger.info(f"Normalizing {table_format} metadata")
+        # TableFormat is a str enum, so names look up the same entries
+        normalize_format = self._dispatch.get(table_format)
+        if normalize_format is None:
+            raise NormalizationError(
+                f"Unsupported table format: {table_format}",
+                details={"format": table_format}
+            )
+        table_format = TableFormat(table_format).value
+        
+        logger.debug("Normalizing %s metadata", table_format)
+        
+        now = datetime.now()
         
         try:
-            if table_format == "ICEBERG":
-                return self._normalize_iceberg(raw_metadata)
-            elif table_format == "DELTA":
-                return self._normalize_delta(raw_metadata)
-            elif table_format == "HUDI":
-                return self._normalize_hudi(raw_metadata)
-            else:
-                raise NormalizationError(
-                    f"Unsupported table format: {table_format}",
-                    details={"format": table_format}
-                )
+            return normalize_format(raw_metadata, now)
         except NormalizationError:
             raise
         except Exception as e:
@@ -108,7 +168,7 @@ class MetadataNormalizer:
                 details={"format": table_format, "error": str(e)}
             )
     
-    def _normalize_iceberg(self, raw_metadata: Dict) -> TableMetadata:
+    def _normalize_iceberg(self, raw_metadata: Dict, now: datetime) -> TableMetadata:
         """Normalize Iceberg metadata to TableMetadata."""
         logger.debug("Normalizing Iceberg metadata")
         
@@ -137,7 +197,7 @@ class MetadataNormalizer:
             partitions=partitions,
             properties=raw_metadata.get("properties", {}),
             supports_time_travel=supports_time_travel,
-            updated_at=datetime.now()
+            updated_at=now
         )
         
         # Add format-specific properties
@@ -146,10 +206,10 @@ class MetadataNormalizer:
         if raw_metadata.get("format_version"):
             metadata.properties["iceberg.format_version"] = str(raw_metadata["format_version"])
         
-        logger.info(f"Normalized Iceberg table: {table_name} with {len(columns)} columns")
+        logger.debug("Normalized Iceberg table: %s with %d columns", table_name, len(metadata.columns))
         return metadata
     
-    def _normalize_delta(self, raw_metadata: Dict) -> TableMetadata:
+    def _normalize_delta(self, raw_metadata: Dict, now: datetime) -> TableMetadata:
         """Normalize Delta Lake metadata to TableMetadata."""
         logger.debug("Normalizing Delta metadata")
         
@@ -177,7 +237,7 @@ class MetadataNormalizer:
             partitions=partitions,
             properties=raw_metadata.get("properties", {}),
             supports_time_travel=supports_time_travel,
-            updated_at=datetime.now()
+            updated_at=now
         )
         
         # Add format-specific properties
@@ -188,10 +248,10 @@ class MetadataNormalizer:
             metadata.properties["delta.minReaderVersion"] = str(protocol.get("minReaderVersion", ""))
             metadata.properties["delta.minWriterVersion"] = str(protocol.get("minWriterVersion", ""))
         
-        logger.info(f"Normalized Delta table: {table_name} with {len(columns)} columns")
+        logger.debug("Normalized Delta table: %s with %d columns", table_name, len(metadata.columns))
         return metadata
     
-    def _normalize_hudi(self, raw_metadata: Dict) -> TableMetadata:
+    def _normalize_hudi(self, raw_metadata: Dict, now: datetime) -> TableMetadata:
         """Normalize Hudi metadata to TableMetadata."""
         logger.debug("Normalizing Hudi metadata")
         
@@ -217,7 +277,7 @@ class MetadataNormalizer:
             partitions=partitions,
             properties=raw_metadata.get("properties", {}),
             supports_time_travel=supports_time_travel,
-            updated_at=datetime.now()
+            updated_at=now
         )
         
         # Add format-specific properties
@@ -227,170 +287,116 @@ class MetadataNormalizer:
         if timeline:
             metadata.properties["hudi.commits.count"] = str(len(timeline))
         
-        logger.info(f"Normalized Hudi table: {table_name} with {len(columns)} columns")
+        logger.debug("Normalized Hudi table: %s with %d columns", table_name, len(metadata.columns))
         return metadata
     
-    def _normalize_iceberg_columns(self, schema_fields: List[Dict]) -> List[ColumnMetadata]:
-        """Convert Iceberg schema fields to ColumnMetadata."""
-        columns = []
-        
-        for field in schema_fields:
-            name = field.get("name", "")
-            field_type = field.get("type", "string")
-            
-            # Handle complex types (struct, list, map)
-            if isinstance(field_type, dict):
-                field_type = field_type.get("type", "string")
-            
-            # Map Iceberg type to SQL type
-            sql_type = self._map_iceberg_type(field_type)
-            
-            # Iceberg uses "required" field (True means NOT NULL)
-            nullable = not field.get("required", False)
-            
-            comment = field.get("doc") or field.get("comment")
-            
-            columns.append(ColumnMetadata(
-                name=name,
-                data_type=sql_type,
-                nullable=nullable,
-                comment=comment
-            ))
+    def _normalize_iceberg_columns(self, schema_fields: List[Dict]) -> Iterator[ColumnMetadata]:
+        """
+        Convert Iceberg schema fields to ColumnMetadata.
         
-        return columns
+        Returns a generator: TableMetadata materializes it into its columns
+        list, so no intermediate list is built.
+        """
+        # Bind lookups to locals: this runs once per column on wide schemas
+        column = ColumnMetadata
+        map_type = self._map_type
+        
+        return (
+            column(
+                name=field.get("name", ""),
+                data_type=map_type(_field_type(field), TableFormat.ICEBERG),
+                # Iceberg uses "required" field (True means NOT NULL)
+                nullable=not field.get("required", False),
+                comment=field.get("doc") or field.get("comment")
+            )
+            for field in schema_fields
+        )
     
-    def _normalize_delta_columns(self, schema_fields: List[Dict]) -> List[ColumnMetadata]:
+    def _normalize_delta_columns(self, schema_fields: List[Dict]) -> Iterator[ColumnMetadata]:
         """Convert Delta schema fields to ColumnMetadata."""
-        columns = []
-        
-        for field in schema_fields:
-            name = field.get("name", "")
-            field_type = field.get("type", "string")
-            
-            # Handle complex types
-            if isinstance(field_type, dict):
-                field_type = field_type.get("type", "string")
-            
-            # Map Delta type to SQL type
-            sql_type = self._map_delta_type(field_type)
-            
-            nullable = field.get("nullable", True)
-            
-            # Delta stores metadata in a nested dict
-            metadata = field.get("metadata", {})
-            comment = metadata.get("comment")
-            
-            columns.append(ColumnMetadata(
-                name=name,
-                data_type=sql_type,
-                nullable=nullable,
-                comment=comment
-            ))
-        
-        return columns
+        column = ColumnMetadata
+        map_type = self._map_type
+        
+        return (
+            column(
+                name=field.get("name", ""),
+                data_type=map_type(_field_type(field), TableFormat.DELTA),
+                nullable=field.get("nullable", True),
+                # Delta stores metadata in a nested dict
+                comment=field.get("metadata", {}).get("comment")
+            )
+            for field in schema_fields
+        )
     
-    def _normalize_hudi_columns(self, schema_fields: List[Dict]) -> List[ColumnMetadata]:
+    def _normalize_hudi_columns(self, schema_fields: List[Dict]) -> Iterator[ColumnMetadata]:
         """Convert Hudi schema fields to ColumnMetadata."""
-        columns = []
-        
-        for field in schema_fields:
-            name = field.get("name", "")
-            field_type = field.get("type", "string")
-            
-            # Handle complex types
-            if isinstance(field_type, dict):
-                field_type = field_type.get("type", "string")
-            
-            # Map Hudi type to SQL type
-            sql_type = self._map_hudi_type(field_type)
-            
-            # Hudi schema is based on Avro, which has "null" unions for nullable
-            nullable = True  # Default to nullable unless specified
-            if isinstance(field_type, list):
-                nullable = "null" in field_type
-            
-            comment = field.get("doc")
-            
-            columns.append(ColumnMetadata(
-                name=name,
-                data_type=sql_type,
+        column = ColumnMetadata
+        map_type = self._map_hudi_type
+        
+        return (
+            column(
+                name=field.get("name", ""),
+                data_type=map_type(field_type),
+                # Hudi schema is based on Avro, which has "null" unions for nullable
                 nullable=nullable,
-                comment=comment
-            ))
-        
-        return columns
+                comment=field.get("doc")
+            )
+            for field in schema_fields
+            for field_type, nullable in (_hudi_field_type(field),)
+        )
     
     def _extract_iceberg_partition_columns(self, partition_spec: List[Dict],
                                           schema: List[Dict]) -> List[str]:
         """Extract partition column names from Iceberg partition spec."""
-        partition_columns = []
-        
-        # Build a map of field IDs to names
-        field_id_to_name = {field.get("id"): field.get("name") for field in schema}
-        
-        for partition_field in partition_spec:
-            # Partition spec references source column by field ID
-            source_id = partition_field.get("source-id") or partition_field.get("sourceId")
-            if source_id and source_id in field_id_to_name:
-                partition_columns.append(field_id_to_name[source_id])
-        
-        return partition_columns
+        # Build a map of field IDs to names; unnamed fields are left out so a
+        # single get() both finds the source column and filters misses
+        field_id_to_name = {
+            field["id"]: field["name"]
+            for field in schema
+            if "id" in field and "name" in field
+        }
+        
+        # Partition spec references source column by field ID
+        return [
+            name
+            for partition_field in partition_spec
+            if (name := field_id_to_name.get(
+                partition_field.get("source-id") or partition_field.get("sourceId")
+            )) is not None
+        ]
     
-    def _map_iceberg_type(self, iceberg_type: str) -> str:
-        """Map Iceberg type to SQL type."""
-        # Handle parameterized types like decimal(10,2)
-        base_type = iceberg_type.split("(")[0].lower()
-        
-        sql_type = self.ICEBERG_TYPE_MAP.get(base_type)
-        if sql_type:
-            # Preserve parameters for types like decimal
-            if "(" in iceberg_type:
-                sql_type += iceberg_type[iceberg_type.index("("):]
-            return sql_type
+    def _map_type(self, type_name: str, table_format: TableFormat,
+                  keep_params: bool = True) -> str:
+        """
+        Map a format-specific type name to a SQL type.
         
-        # Default to VARCHAR for unknown types
-        logger.warning(f"Unknown Iceberg type: {iceberg_type}, defaulting to VARCHAR")
-        return "VARCHAR"
-    
-    def _map_delta_type(self, delta_type: str) -> str:
-        """Map Delta type to SQL type."""
-        base_type = delta_type.split("(")[0].lower()
+        Results are memoized per instance (see __init__), so an unknown
+        type is only warned about the first time it is seen.
         
-        sql_type = self.DELTA_TYPE_MAP.get(base_type)
+        Args:
+            type_name: Type as written by the format, e.g. "decimal(10,2)"
+            table_format: Format whose type map applies
+            keep_params: Append parameters like "(10,2)" to the SQL type
+            
+        Returns:
+            SQL type, or VARCHAR for unknown types
+        """
+        match = self._TYPE_RE.match(type_name)
+        sql_type = self.TYPE_MAPS[table_format].get(match.group(1).lower()) if match else None
         if sql_type:
-            if "(" in delta_type:
-                sql_type += delta_type[delta_type.index("("):]
+            if keep_params and match.group(2):
+                return sql_type + match.group(2)
             return sql_type
         
-        logger.warning(f"Unknown Delta type: {delta_type}, defaulting to VARCHAR")
+        # Default to VARCHAR for unknown types
+        logger.warning("Unknown %s type: %s, defaulting to VARCHAR", table_format.value.title(), type_name)
         return "VARCHAR"
     
     def _map_hudi_type(self, hudi_type: str) -> str:
-        """Map Hudi type to SQL type."""
-        # Hudi types can be Avro types
-        if isinstance(hudi_type, list):
-            # Union type, find non-null type
-            non_null_types = [t for t in hudi_type if t != "null"]
-            hudi_type = non_null_types[0] if non_null_types else "string"
-        
-        base_type = str(hudi_type).split("(")[0].lower()
-        
-        sql_type = self.HUDI_TYPE_MAP.get(base_type)
-        if sql_type:
-            return sql_type
-        
-        logger.warning(f"Unknown Hudi type: {hudi_type}, defaulting to VARCHAR")
-        return "VARCHAR"
+        """Map Hudi type (unions already resolved by _hudi_field_type) to SQL type."""
+        return self._map_type(str(hudi_type), TableFormat.HUDI, keep_params=False)
     
     def _extract_table_name_from_path(self, s3_path: str) -> str:
         """Extract table name from S3 path."""
-        # Remove s3:// prefix and get last path component
-        path = s3_path.replace("s3://", "")
-        parts = path.rstrip("/").split("/")
-        
-        # Return last non-empty part
-        for part in reversed(parts):
-            if part:
-                return part
-        
-        return "unknown_table"
+        # Cached: bulk discovery re-normalizes the same locations repeatedly
+        return _extract_table_name(s3_path)
@@ -1,7 +1,26 @@
 """Format-specific metadata readers."""
 
-from .iceberg_reader import IcebergReader
-from .delta_reader import DeltaReader
-from .hudi_reader import HudiReader
+import importlib
 
 __all__ = ["IcebergReader", "DeltaReader", "HudiReader"]
+
+# Reader modules are imported on first attribute access (PEP 562), so
+# importing the package for one format does not load the others
+_READER_MODULES = {
+    "IcebergReader": ".iceberg_reader",
+    "DeltaReader": ".delta_reader",
+    "HudiReader": ".hudi_reader",
+}
+
+
+def __getattr__(name):
+    module_name = _READER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    reader = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = reader
+    return reader
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
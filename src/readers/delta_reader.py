@@ -5,16 +5,57 @@ Reads and parses Delta Lake table metadata from S3.
 Returns raw metadata without normalization.
 """
 
-import json
-import boto3
-from typing import Dict, Optional, List
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, Iterator, Optional, List
+
+import orjson
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 
 from ..utils.logger import setup_logger
+from ..utils.s3_utils import get_s3_client, parse_table_path
 from ..utils.exceptions import MetadataReadError
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Without pyarrow, metadata comes from JSON commits only
+    pa = pq = None
+
 logger = setup_logger(__name__)
 
+# S3 Select query returning only the commit lines _merge_log_entries needs
+LOG_SELECT_EXPRESSION = (
+    'SELECT * FROM S3Object s '
+    'WHERE s."metaData" IS NOT NULL OR s."protocol" IS NOT NULL'
+)
+
+# Checkpoint columns holding the actions read_metadata needs; projecting
+# them skips decoding the (much larger) add/remove columns
+CHECKPOINT_COLUMNS = ['metaData', 'protocol']
+
+# Tables whose parsed metadata is kept for reuse (least recently used evicted)
+METADATA_CACHE_MAXSIZE = 1024
+
+
+@lru_cache(maxsize=256)
+def _parse_schema_fields(schema_string: str) -> tuple:
+    """
+    Parse a schemaString into its fields, memoized by content.
+    
+    Schemas rarely change between versions, so repeated reads of a table
+    (and tables sharing a schema) hit the cache instead of re-parsing JSON
+    that can exceed 100 KB. The field dicts are shared and read-only.
+    
+    Raises:
+        orjson.JSONDecodeError: If schema_string is not valid JSON
+    """
+    return tuple(orjson.loads(schema_string).get("fields", []))
+
 
 class DeltaReader:
     """
@@ -27,7 +68,10 @@ class DeltaReader:
     
     def __init__(self, aws_access_key_id: Optional[str] = None,
                  aws_secret_access_key: Optional[str] = None,
-                 region_name: str = "us-east-1"):
+                 region_name: str = "us-east-1",
+                 s3_client: Optional[BaseClient] = None,
+                 use_s3_select: bool = False,
+                 metadata_max_staleness: float = 30.0):
         """
         Initialize the Delta Lake metadata reader.
         
@@ -35,14 +79,30 @@ class DeltaReader:
             aws_access_key_id: AWS access key (optional)
             aws_secret_access_key: AWS secret key (optional)
             region_name: AWS region name
+            s3_client: Existing S3 client to use instead of looking one up
+                from the credentials (lets callers share one connection pool)
+            use_s3_select: Filter commit files server-side with S3 Select so
+                add/remove actions are never downloaded. Off by default:
+                S3 Select is not available to every account; if a request
+                is rejected the reader falls back to a plain GET.
+            metadata_max_staleness: Seconds a table's metadata is served from
+                cache without touching S3. Older entries are revalidated by
+                locating the latest commit and are reused if it has not
+                changed, skipping the commit download and parse. 0 disables
+                the cache.
         """
-        self.s3_client = boto3.client(
-            's3',
+        self.s3_client = s3_client or get_s3_client(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name
         )
-        logger.info("DeltaReader initialized")
+        self.use_s3_select = use_s3_select
+        self.metadata_max_staleness = metadata_max_staleness
+        # s3_path -> (checked_at, latest commit key, orjson-encoded metadata);
+        # encoded so every caller gets its own copy to mutate
+        self._metadata_cache: OrderedDict = OrderedDict()
+        self._metadata_cache_lock = threading.Lock()
+        logger.debug("DeltaReader initialized")
     
     def read_metadata(self, s3_path: str) -> Dict:
         """
@@ -63,13 +123,24 @@ class DeltaReader:
         Raises:
             MetadataReadError: If metadata cannot be read
         """
-        logger.info(f"Reading Delta metadata from: {s3_path}")
+        logger.debug("Reading Delta metadata from: %s", s3_path)
         
         try:
             bucket, prefix = self._parse_s3_path(s3_path)
             
+            cached = self._get_cached_metadata(s3_path)
+            if cached is not None and time.monotonic() - cached[0] < self.metadata_max_staleness:
+                logger.debug("Using cached Delta metadata for %s", s3_path)
+                return orjson.loads(cached[2])
+            
             # Get the latest transaction log
-            latest_version, log_entry = self._get_latest_log_entry(bucket, prefix)
+            latest_key, checkpoint = self._get_latest_log_key(bucket, prefix)
+            if cached is not None and cached[1] == latest_key:
+                logger.debug("Delta table %s unchanged since last read", s3_path)
+                self._cache_metadata(s3_path, latest_key, cached[2])
+                return orjson.loads(cached[2])
+            
+            latest_version, log_entry = self._read_log_entry(bucket, latest_key, prefix, checkpoint)
             
             # Parse metadata from log entry
             raw_metadata = {
@@ -84,9 +155,10 @@ class DeltaReader:
                 "protocol": self._extract_protocol(log_entry)
             }
             
-            logger.info(f"Successfully read Delta metadata: version {latest_version}, "
-                       f"{len(raw_metadata['schema'])} columns")
+            logger.debug("Successfully read Delta metadata: version %d, %d columns",
+                         latest_version, len(raw_metadata['schema']))
             
+            self._cache_metadata(s3_path, latest_key, orjson.dumps(raw_metadata))
             return raw_metadata
             
         except MetadataReadError:
@@ -97,117 +169,380 @@ class DeltaReader:
                 details={"path": s3_path, "error": str(e)}
             )
     
+    def _get_cached_metadata(self, s3_path: str) -> Optional[tuple]:
+        """
+        Look up cached metadata for a table.
+        
+        Returns:
+            (checked_at, latest commit key, encoded metadata), or None if the
+            table is not cached or caching is disabled
+        """
+        if self.metadata_max_staleness <= 0:
+            return None
+        with self._metadata_cache_lock:
+            entry = self._metadata_cache.get(s3_path)
+            if entry is not None:
+                self._metadata_cache.move_to_end(s3_path)
+            return entry
+    
+    def _cache_metadata(self, s3_path: str, latest_key: str, encoded: bytes) -> None:
+        """
+        Remember a table's metadata as of its latest commit.
+        
+        Evicts the least recently used entry when the cache is full.
+        """
+        if self.metadata_max_staleness <= 0:
+            return
+        with self._metadata_cache_lock:
+            self._metadata_cache[s3_path] = (time.monotonic(), latest_key, encoded)
+            self._metadata_cache.move_to_end(s3_path)
+            if len(self._metadata_cache) > METADATA_CACHE_MAXSIZE:
+                self._metadata_cache.popitem(last=False)
+    
     def _parse_s3_path(self, s3_path: str) -> tuple[str, str]:
         """Parse S3 path into bucket and prefix."""
-        if not s3_path.startswith("s3://"):
+        parsed = parse_table_path(s3_path)
+        if parsed is None:
             raise MetadataReadError(f"Invalid S3 path format: {s3_path}")
-        
-        path_parts = s3_path.replace("s3://", "").split("/", 1)
-        bucket = path_parts[0]
-        prefix = path_parts[1] if len(path_parts) > 1 else ""
-        
-        if prefix and not prefix.endswith("/"):
-            prefix += "/"
-        
-        return bucket, prefix
+        return parsed
     
-    def _get_latest_log_entry(self, bucket: str, prefix: str) -> tuple[int, Dict]:
+    def _get_latest_log_key(self, bucket: str, prefix: str) -> tuple[str, Optional[Dict]]:
         """
-        Get the latest Delta transaction log entry.
+        Get the key of the latest Delta transaction log file.
         
         Args:
             bucket: S3 bucket name
             prefix: Table prefix
             
         Returns:
-            Tuple of (version_number, log_entry_dict)
+            Tuple of (S3 key of the latest commit file, contents of
+            _last_checkpoint or None if the table has no checkpoint)
         """
         delta_log_prefix = f"{prefix}_delta_log/"
         
         try:
-            # List all JSON log files
-            response = self.s3_client.list_objects_v2(
-                Bucket=bucket,
-                Prefix=delta_log_prefix
+            return self._find_latest_log_key(bucket, delta_log_prefix)
+        except ClientError as e:
+            raise MetadataReadError(
+                f"Failed to read Delta log files: {str(e)}",
+                details={"bucket": bucket, "prefix": delta_log_prefix, "error": str(e)}
             )
+    
+    def _read_log_entry(self, bucket: str, log_key: str, prefix: str,
+                        checkpoint: Optional[Dict]) -> tuple[int, Dict]:
+        """
+        Read a Delta transaction log file.
+        
+        Commits are replayed newest first, from log_key back to the one
+        after the checkpoint, until both a metaData and a protocol action
+        have been found; only then (and only when pyarrow is installed) is
+        the checkpoint itself read.
+        
+        Args:
+            bucket: S3 bucket name
+            log_key: S3 key of the commit file
+            prefix: Table prefix
+            checkpoint: Contents of _last_checkpoint, or None
             
-            if 'Contents' not in response:
-                raise MetadataReadError(
-                    f"No transaction log files found in {delta_log_prefix}",
-                    details={"bucket": bucket, "prefix": delta_log_prefix}
-                )
-            
-            # Filter for transaction log JSON files (format: 00000000000000000000.json)
-            log_files = [
-                obj for obj in response['Contents']
-                if obj['Key'].endswith('.json') and not obj['Key'].endswith('.checkpoint.json')
-            ]
-            
-            if not log_files:
-                raise MetadataReadError(
-                    f"No valid transaction log files found in {delta_log_prefix}",
-                    details={"bucket": bucket, "prefix": delta_log_prefix}
-                )
-            
-            # Sort by file name (which contains version number) and get the latest
-            log_files.sort(key=lambda x: x['Key'])
-            latest_log = log_files[-1]
+        Returns:
+            Tuple of (version_number, log_entry_dict)
+        """
+        # Extract version number from filename
+        filename = log_key.split('/')[-1]
+        version = int(filename.replace('.json', ''))
+        
+        logger.debug("Found latest log file: %s, version: %d", log_key, version)
+        
+        # Commit keys are zero-padded versions, so the commits written since
+        # the checkpoint are known without listing them again
+        oldest = checkpoint["version"] + 1 if checkpoint is not None else version
+        commit_keys = [
+            f"{prefix}_delta_log/{commit_version:020d}.json"
+            for commit_version in range(version, oldest - 1, -1)
+        ]
+        commit_keys[0] = log_key
+        
+        # Merge all entries to get complete metadata. Each older commit (and
+        # the checkpoint) is only read if the newer ones lack a metaData or
+        # protocol action.
+        actions = chain.from_iterable(
+            self._iter_actions(self._read_commit(bucket, key)) for key in commit_keys
+        )
+        if checkpoint is not None and pq is not None:
+            actions = chain(actions, self._iter_checkpoint_actions(bucket, prefix, checkpoint))
+        log_entry = self._merge_log_entries(actions)
+        
+        if "schemaString" not in log_entry:
+            logger.warning("No metaData action found for Delta table s3://%s/%s at version %d",
+                           bucket, prefix, version)
+        return version, log_entry
+    
+    def _read_commit(self, bucket: str, key: str) -> bytes:
+        """
+        Read a commit file, filtered server-side when S3 Select is enabled.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Commit file key
             
-            # Extract version number from filename
-            filename = latest_log['Key'].split('/')[-1]
-            version = int(filename.replace('.json', ''))
+        Returns:
+            Newline-delimited JSON actions
+        """
+        try:
+            if self.use_s3_select:
+                return self._read_log_filtered(bucket, key)
+            return self._read_s3_object(bucket, key)
+        except ClientError as e:
+            raise MetadataReadError(
+                f"Failed to read Delta log files: {str(e)}",
+                details={"bucket": bucket, "key": key, "error": str(e)}
+            )
+    
+    def _find_latest_log_key(self, bucket: str, delta_log_prefix: str) -> tuple[str, Optional[Dict]]:
+        """
+        Find the key of the newest JSON commit file.
+        
+        When _delta_log/_last_checkpoint exists, only the commits written
+        after that checkpoint are listed (commit keys are zero-padded, so
+        they sort by version); otherwise the whole log is paged through.
+        
+        Args:
+            bucket: S3 bucket name
+            delta_log_prefix: Prefix of the _delta_log/ directory
             
-            logger.debug(f"Found latest log file: {latest_log['Key']}, version: {version}")
+        Returns:
+            Tuple of (S3 key of the latest commit file, contents of
+            _last_checkpoint or None)
+        """
+        checkpoint = self._read_last_checkpoint(bucket, delta_log_prefix)
+        
+        if checkpoint is not None:
+            checkpoint_key = f"{delta_log_prefix}{checkpoint['version']:020d}.json"
+            latest = self._latest_log_file(bucket, delta_log_prefix, start_after=checkpoint_key)
+            if latest:
+                return latest, checkpoint
+            # No commits since the checkpoint: its own commit is the latest,
+            # unless log cleanup already removed it
+            if self._object_exists(bucket, checkpoint_key):
+                return checkpoint_key, checkpoint
+            logger.debug("Checkpoint commit %s not found, listing full log", checkpoint_key)
+        
+        latest = self._latest_log_file(bucket, delta_log_prefix)
+        if not latest:
+            raise MetadataReadError(
+                f"No valid transaction log files found in {delta_log_prefix}",
+                details={"bucket": bucket, "prefix": delta_log_prefix}
+            )
+        return latest, checkpoint
+    
+    def _read_last_checkpoint(self, bucket: str, delta_log_prefix: str) -> Optional[Dict]:
+        """
+        Read the checkpoint pointer in _delta_log/_last_checkpoint.
+        
+        Returns:
+            The pointer (with "version" as an int, plus "parts" for
+            multi-part checkpoints), or None if the table has no (readable)
+            checkpoint
+        """
+        key = f"{delta_log_prefix}_last_checkpoint"
+        try:
+            response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return None
+            raise
+        
+        try:
+            checkpoint = orjson.loads(response['Body'].read())
+            checkpoint["version"] = int(checkpoint["version"])
+            return checkpoint
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable checkpoint pointer s3://%s/%s: %s", bucket, key, e)
+            return None
+    
+    def _latest_log_file(self, bucket: str, delta_log_prefix: str,
+                         start_after: Optional[str] = None) -> Optional[str]:
+        """
+        Find the newest commit (NNN.json) file key by paging through the log.
+        
+        S3 lists keys in lexicographic order and commit keys are zero-padded,
+        so the last matching key seen is the latest version; pages are
+        streamed without collecting or sorting the keys. The delimiter keeps
+        sub-directories such as _delta_log/_commits/ out of the listing.
+        
+        Args:
+            bucket: S3 bucket name
+            delta_log_prefix: Prefix of the _delta_log/ directory
+            start_after: Only list keys that sort after this one
             
-            # Read and parse the log file
-            log_content = self._read_s3_object(bucket, latest_log['Key'])
+        Returns:
+            Key of the latest commit file, or None if there is none
+        """
+        paginate_kwargs = {"Bucket": bucket, "Prefix": delta_log_prefix, "Delimiter": "/"}
+        if start_after:
+            paginate_kwargs["StartAfter"] = start_after
+        
+        latest = None
+        for page in self.s3_client.get_paginator('list_objects_v2').paginate(**paginate_kwargs):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                # Filter for transaction log JSON files (format: 00000000000000000000.json)
+                if key.endswith('.json') and not key.endswith('.checkpoint.json'):
+                    latest = key
+        return latest
+    
+    def _object_exists(self, bucket: str, key: str) -> bool:
+        """Check whether an object exists with a HEAD request."""
+        try:
+            self.s3_client.head_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return False
+            raise
+    
+    def _checkpoint_keys(self, delta_log_prefix: str, checkpoint: Dict) -> List[str]:
+        """
+        List the Parquet file keys making up a checkpoint.
+        
+        Args:
+            delta_log_prefix: Prefix of the _delta_log/ directory
+            checkpoint: Contents of _last_checkpoint
             
-            # Delta log files contain one JSON object per line
-            log_entries = [json.loads(line) for line in log_content.strip().split('\n') if line.strip()]
+        Returns:
+            Keys of the single-file checkpoint, or of every part of a
+            multi-part checkpoint
+        """
+        base = f"{delta_log_prefix}{checkpoint['version']:020d}.checkpoint"
+        parts = checkpoint.get("parts")
+        if not parts:
+            return [f"{base}.parquet"]
+        return [f"{base}.{part:010d}.{parts:010d}.parquet" for part in range(1, parts + 1)]
+    
+    def _iter_checkpoint_actions(self, bucket: str, prefix: str,
+                                 checkpoint: Dict) -> Iterator[Dict]:
+        """
+        Read the metaData and protocol actions from a Parquet checkpoint.
+        
+        A checkpoint holds the table state as of its version, so metadata
+        set by an older commit is found in one columnar read instead of
+        replaying JSON commits. Only the metaData and protocol columns are
+        decoded. A checkpoint that cannot be read yields nothing and is
+        logged, leaving the commit's own actions as the result.
+        
+        Args:
+            bucket: S3 bucket name
+            prefix: Table prefix
+            checkpoint: Contents of _last_checkpoint
             
-            # Merge all entries to get complete metadata
-            merged_metadata = self._merge_log_entries(log_entries)
+        Yields:
+            {"metaData": {...}} and {"protocol": {...}} action dictionaries
+        """
+        for key in self._checkpoint_keys(f"{prefix}_delta_log/", checkpoint):
+            try:
+                table = pq.read_table(
+                    pa.BufferReader(self._read_s3_object(bucket, key)),
+                    columns=CHECKPOINT_COLUMNS
+                )
+            except (MetadataReadError, pa.ArrowException) as e:
+                logger.warning("Could not read Delta checkpoint s3://%s/%s: %s", bucket, key, e)
+                return
             
-            return version, merged_metadata
+            for column in CHECKPOINT_COLUMNS:
+                values = table.column(column).drop_null()
+                if len(values):
+                    action = values[0].as_py()
+                    if column == 'metaData':
+                        # Parquet map columns come back as lists of pairs
+                        action["configuration"] = dict(action.get("configuration") or ())
+                    yield {column: action}
+    
+    def _read_log_filtered(self, bucket: str, key: str) -> bytes:
+        """
+        Read only the metaData and protocol lines of a commit file.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Commit file key
             
-        except ClientError as e:
-            raise MetadataReadError(
-                f"Failed to read Delta log files: {str(e)}",
-                details={"bucket": bucket, "prefix": delta_log_prefix, "error": str(e)}
+        Returns:
+            Newline-delimited JSON of the matching actions
+        """
+        try:
+            response = self.s3_client.select_object_content(
+                Bucket=bucket,
+                Key=key,
+                ExpressionType='SQL',
+                Expression=LOG_SELECT_EXPRESSION,
+                InputSerialization={'JSON': {'Type': 'LINES'}},
+                OutputSerialization={'JSON': {'RecordDelimiter': '\n'}}
+            )
+            return b''.join(
+                event['Records']['Payload']
+                for event in response['Payload']
+                if 'Records' in event
             )
+        except ClientError as e:
+            logger.warning("S3 Select failed for s3://%s/%s, reading whole file: %s", bucket, key, e)
+            return self._read_s3_object(bucket, key)
     
-    def _read_s3_object(self, bucket: str, key: str) -> str:
-        """Read content from S3 object."""
+    def _read_s3_object(self, bucket: str, key: str) -> bytes:
+        """Read the raw content of an S3 object."""
         try:
             response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            return content
+            return response['Body'].read()
         except ClientError as e:
             raise MetadataReadError(
                 f"Failed to read S3 object s3://{bucket}/{key}: {str(e)}",
                 details={"bucket": bucket, "key": key, "error": str(e)}
             )
     
-    def _merge_log_entries(self, log_entries: List[Dict]) -> Dict:
+    def _iter_actions(self, log_content: bytes) -> Iterator[Dict]:
+        """
+        Parse a commit file's metaData and protocol actions, newest first.
+        
+        Delta log files contain one JSON object per line. orjson parses the
+        raw bytes, so the log is never decoded to str. Lines that cannot hold
+        a metaData or protocol action (no such key anywhere in the line,
+        e.g. add/remove actions) are skipped without being parsed.
+        
+        Most commits after the first are plain appends with neither action,
+        so the whole buffer is searched first; such commits are not even
+        split into lines, and older commits supply the actions instead.
+        """
+        if b'"metaData"' not in log_content and b'"protocol"' not in log_content:
+            return
+        for line in reversed(log_content.splitlines()):
+            if b'"metaData"' in line or b'"protocol"' in line:
+                yield orjson.loads(line)
+    
+    def _merge_log_entries(self, log_entries: Iterable[Dict]) -> Dict:
         """
         Merge multiple log entries into a single metadata dictionary.
         
         Delta log files can contain multiple action types: metaData, protocol, add, remove, etc.
-        We're primarily interested in metaData action.
+        We're primarily interested in metaData action. Only the last metaData
+        and protocol actions matter, so entries are scanned newest first and
+        the scan stops once both have been found.
         
         Args:
-            log_entries: List of parsed JSON log entries
+            log_entries: Parsed JSON log entries, newest first
             
         Returns:
             Merged metadata dictionary
         """
         merged = {}
+        seen_metadata = seen_protocol = False
         
         for entry in log_entries:
-            if "metaData" in entry:
+            if not seen_metadata and "metaData" in entry:
                 merged.update(entry["metaData"])
-            if "protocol" in entry:
+                seen_metadata = True
+            if not seen_protocol and "protocol" in entry:
                 merged["protocol"] = entry["protocol"]
+                seen_protocol = True
+            if seen_metadata and seen_protocol:
+                break
         
         return merged
     
@@ -226,11 +561,9 @@ class DeltaReader:
         schema_string = log_entry.get("schemaString", "{}")
         
         try:
-            schema = json.loads(schema_string)
-            fields = schema.get("fields", [])
-            return fields
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse schema string: {e}")
+            return list(_parse_schema_fields(schema_string))
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse schema string: %s", e)
             return []
     
     def _extract_partition_columns(self, log_entry: Dict) -> List[str]:
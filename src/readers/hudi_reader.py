@@ -5,18 +5,71 @@ Reads and parses Apache Hudi table metadata from S3.
 Returns raw metadata without normalization.
 """
 
-import json
-import boto3
-from typing import Dict, Optional, List
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Optional, List, Union
+
+import orjson
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError
-from configparser import ConfigParser
-from io import StringIO
 
 from ..utils.logger import setup_logger
+from ..utils.s3_utils import get_s3_client, parse_table_path
 from ..utils.exceptions import MetadataReadError
 
+try:
+    import ijson
+except ImportError:  # Fall back to parsing whole commit files with orjson
+    ijson = None
+
 logger = setup_logger(__name__)
 
+# Backslash escapes Java's Properties.store writes before these characters
+_PROPERTIES_ESCAPE_RE = re.compile(r'\\([:=#! ])')
+
+# Timeline files that make up the commit timeline
+HUDI_COMMIT_EXTENSIONS = ('.commit', '.deltacommit', '.replacecommit', '.inflight')
+
+# Sort key for timeline entries: the instant time from the file name
+_commit_time = itemgetter("commit_time")
+
+# hoodie.properties files remembered (with their ETag) for conditional GETs
+PROPERTIES_CACHE_MAXSIZE = 1024
+
+# Commit files fetched concurrently while searching the timeline (newest
+# first) for a schema; each GET is dominated by S3 round-trip latency
+SCHEMA_SEARCH_BATCH_SIZE = 8
+
+# Parse errors that mean a commit file holds no readable schema
+COMMIT_JSON_ERRORS = (orjson.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+
+def _parse_properties(content: str) -> Dict[str, str]:
+    """
+    Parse a Java properties file (key=value or key:value lines).
+    
+    Blank lines and #/! comments are skipped; the separator is the first
+    "=" or ":" on the line, and the backslash escapes Java writes before
+    ":", "=", "#" and "!" (e.g. "s3a\\://bucket") are removed.
+    """
+    properties = {}
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line[0] in '#!':
+            continue
+        separators = [i for i in (line.find('='), line.find(':')) if i >= 0]
+        if not separators:
+            continue
+        sep = min(separators)
+        key, value = line[:sep].strip(), line[sep + 1:].strip()
+        if '\\' in value:
+            value = _PROPERTIES_ESCAPE_RE.sub(r'\1', value)
+        properties[key] = value
+    return properties
+
 
 class HudiReader:
     """
@@ -30,7 +83,8 @@ class HudiReader:
     
     def __init__(self, aws_access_key_id: Optional[str] = None,
                  aws_secret_access_key: Optional[str] = None,
-                 region_name: str = "us-east-1"):
+                 region_name: str = "us-east-1",
+                 s3_client: Optional[BaseClient] = None):
         """
         Initialize the Hudi metadata reader.
         
@@ -38,14 +92,18 @@ class HudiReader:
             aws_access_key_id: AWS access key (optional)
             aws_secret_access_key: AWS secret key (optional)
             region_name: AWS region name
+            s3_client: Existing S3 client to use instead of looking one up
+                from the credentials (lets callers share one connection pool)
         """
-        self.s3_client = boto3.client(
-            's3',
+        self.s3_client = s3_client or get_s3_client(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name
         )
-        logger.info("HudiReader initialized")
+        # (bucket, key) -> (ETag, parsed properties)
+        self._properties_cache: OrderedDict = OrderedDict()
+        self._properties_cache_lock = threading.Lock()
+        logger.debug("HudiReader initialized")
     
     def read_metadata(self, s3_path: str) -> Dict:
         """
@@ -67,19 +125,22 @@ class HudiReader:
         Raises:
             MetadataReadError: If metadata cannot be read
         """
-        logger.info(f"Reading Hudi metadata from: {s3_path}")
+        logger.debug("Reading Hudi metadata from: %s", s3_path)
         
         try:
             bucket, prefix = self._parse_s3_path(s3_path)
             
-            # Read hoodie.properties
-            properties = self._read_hoodie_properties(bucket, prefix)
-            
-            # Read commit timeline
-            timeline = self._read_commit_timeline(bucket, prefix)
-            
-            # Try to read schema from latest commit
-            schema = self._extract_schema_from_commit(bucket, prefix, timeline)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Read hoodie.properties while the timeline and schema are read
+                properties_future = executor.submit(self._read_hoodie_properties, bucket, prefix)
+                
+                # Read commit timeline
+                timeline = self._read_commit_timeline(bucket, prefix)
+                
+                # Try to read schema from latest commit
+                schema = self._extract_schema_from_commit(bucket, prefix, timeline)
+                
+                properties = properties_future.result()
             
             # Build raw metadata
             raw_metadata = {
@@ -95,8 +156,8 @@ class HudiReader:
                 "base_path": properties.get("hoodie.table.base.path", s3_path)
             }
             
-            logger.info(f"Successfully read Hudi metadata: {len(schema)} columns, "
-                       f"{len(timeline)} commits")
+            logger.debug("Successfully read Hudi metadata: %d columns, %d commits",
+                         len(schema), len(timeline))
             
             return raw_metadata
             
@@ -110,22 +171,19 @@ class HudiReader:
     
     def _parse_s3_path(self, s3_path: str) -> tuple[str, str]:
         """Parse S3 path into bucket and prefix."""
-        if not s3_path.startswith("s3://"):
+        parsed = parse_table_path(s3_path)
+        if parsed is None:
             raise MetadataReadError(f"Invalid S3 path format: {s3_path}")
-        
-        path_parts = s3_path.replace("s3://", "").split("/", 1)
-        bucket = path_parts[0]
-        prefix = path_parts[1] if len(path_parts) > 1 else ""
-        
-        if prefix and not prefix.endswith("/"):
-            prefix += "/"
-        
-        return bucket, prefix
+        return parsed
     
     def _read_hoodie_properties(self, bucket: str, prefix: str) -> Dict[str, str]:
         """
         Read and parse hoodie.properties file.
         
+        Properties rarely change, so the parsed file is cached with its ETag
+        and later reads are conditional GETs (If-None-Match) that transfer
+        no body while the file is unchanged.
+        
         Args:
             bucket: S3 bucket name
             prefix: Table prefix
@@ -135,20 +193,34 @@ class HudiReader:
         """
         properties_key = f"{prefix}.hoodie/hoodie.properties"
         
+        cache_key = (bucket, properties_key)
+        with self._properties_cache_lock:
+            cached = self._properties_cache.get(cache_key)
+        
         try:
-            content = self._read_s3_object(bucket, properties_key)
+            get_kwargs = {"Bucket": bucket, "Key": properties_key}
+            if cached is not None:
+                get_kwargs["IfNoneMatch"] = cached[0]
+            response = self.s3_client.get_object(**get_kwargs)
+            content = response['Body'].read().decode('utf-8')
             
-            # Parse properties file (Java properties format)
-            config = ConfigParser()
-            config.read_string("[DEFAULT]\n" + content)
+            properties = _parse_properties(content)
+            logger.debug("Read %d properties from hoodie.properties", len(properties))
             
-            properties = dict(config.items("DEFAULT"))
-            logger.debug(f"Read {len(properties)} properties from hoodie.properties")
+            with self._properties_cache_lock:
+                self._properties_cache[cache_key] = (response['ETag'], properties)
+                self._properties_cache.move_to_end(cache_key)
+                if len(self._properties_cache) > PROPERTIES_CACHE_MAXSIZE:
+                    self._properties_cache.popitem(last=False)
             
-            return properties
+            # Callers get their own copy; the normalizer adds keys to it
+            return dict(properties)
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
+            if cached is not None and error_code in ('304', 'NotModified'):
+                logger.debug("hoodie.properties unchanged at s3://%s/%s", bucket, properties_key)
+                return dict(cached[1])
             if error_code == 'NoSuchKey':
                 raise MetadataReadError(
                     f"hoodie.properties not found at s3://{bucket}/{properties_key}",
@@ -160,7 +232,7 @@ class HudiReader:
                     details={"bucket": bucket, "key": properties_key, "error": str(e)}
                 )
         except Exception as e:
-            logger.warning(f"Error parsing hoodie.properties: {e}")
+            logger.warning("Error parsing hoodie.properties: %s", e)
             # Return empty dict if parsing fails
             return {}
     
@@ -170,6 +242,12 @@ class HudiReader:
         
         Commit files have extensions like: .commit, .deltacommit, .replacecommit
         
+        The listing is paginated, so timelines longer than one page (1000
+        keys) are read completely. It is delimited, so files under
+        sub-directories (the metadata table's own .hoodie/, archived
+        commits) are not mistaken for table commits; a .hoodie/timeline/
+        directory (Hudi 1.x layout) is read as part of the timeline.
+        
         Args:
             bucket: S3 bucket name
             prefix: Table prefix
@@ -180,28 +258,40 @@ class HudiReader:
         hoodie_prefix = f"{prefix}.hoodie/"
         
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=bucket,
-                Prefix=hoodie_prefix
-            )
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            timeline_prefixes = [hoodie_prefix]
+            commit_files = []
+            found_any = False
             
-            if 'Contents' not in response:
-                logger.warning(f"No files found in {hoodie_prefix}")
-                return []
+            while timeline_prefixes:
+                pages = paginator.paginate(
+                    Bucket=bucket,
+                    Prefix=timeline_prefixes.pop(),
+                    Delimiter='/'
+                )
+                for page in pages:
+                    contents = page.get('Contents', [])
+                    found_any = found_any or bool(contents)
+                    # Filter for commit files (endswith with a tuple checks
+                    # all extensions in one call)
+                    commit_files.extend(
+                        obj for obj in contents
+                        if obj['Key'].endswith(HUDI_COMMIT_EXTENSIONS)
+                    )
+                    for common_prefix in page.get('CommonPrefixes', []):
+                        if common_prefix['Prefix'] == f"{hoodie_prefix}timeline/":
+                            timeline_prefixes.append(common_prefix['Prefix'])
             
-            # Filter for commit files
-            commit_extensions = ['.commit', '.deltacommit', '.replacecommit', '.inflight']
-            commit_files = [
-                obj for obj in response['Contents']
-                if any(obj['Key'].endswith(ext) for ext in commit_extensions)
-            ]
+            if not found_any:
+                logger.warning("No files found in %s", hoodie_prefix)
+                return []
             
             timeline = []
-            for commit_file in sorted(commit_files, key=lambda x: x['LastModified']):
-                filename = commit_file['Key'].split('/')[-1]
+            for commit_file in commit_files:
+                filename = commit_file['Key'].rpartition('/')[2]
                 # Extract timestamp from filename (format: timestamp.commit)
-                commit_time = filename.split('.')[0]
-                commit_type = filename.split('.')[-1]
+                commit_time = filename.partition('.')[0]
+                commit_type = filename.rpartition('.')[2]
                 
                 timeline.append({
                     "commit_time": commit_time,
@@ -210,11 +300,16 @@ class HudiReader:
                     "last_modified": commit_file['LastModified'].isoformat()
                 })
             
-            logger.debug(f"Found {len(timeline)} commits in timeline")
+            # Instant times are sortable timestamps, so ordering by them
+            # avoids comparing datetimes and also merges the root and
+            # timeline/ listings correctly
+            timeline.sort(key=_commit_time)
+            
+            logger.debug("Found %d commits in timeline", len(timeline))
             return timeline
             
         except ClientError as e:
-            logger.warning(f"Failed to read commit timeline: {e}")
+            logger.warning("Failed to read commit timeline: %s", e)
             return []
     
     def _extract_schema_from_commit(self, bucket: str, prefix: str, 
@@ -223,6 +318,9 @@ class HudiReader:
         Extract schema from the latest commit file.
         
         Hudi commit files can contain schema information in JSON format.
+        The newest commit is read on its own first; only if it carries no
+        schema are older commits fetched SCHEMA_SEARCH_BATCH_SIZE at a time,
+        newest first, and the newest one carrying a schema wins.
         
         Args:
             bucket: S3 bucket name
@@ -236,30 +334,88 @@ class HudiReader:
             logger.warning("No commits found in timeline, schema extraction skipped")
             return []
         
-        # Try to read schema from the latest commit
-        for commit in reversed(timeline):  # Start from latest
-            try:
-                commit_key = commit['file_key']
-                content = self._read_s3_object(bucket, commit_key)
-                
-                # Try to parse as JSON
-                commit_data = json.loads(content)
-                
-                # Look for schema in various possible locations
-                if "metadata" in commit_data and "schema" in commit_data["metadata"]:
-                    schema_str = commit_data["metadata"]["schema"]
-                    schema = json.loads(schema_str) if isinstance(schema_str, str) else schema_str
-                    
-                    if "fields" in schema:
-                        return schema["fields"]
-                
-            except (json.JSONDecodeError, KeyError, ClientError) as e:
-                logger.debug(f"Could not extract schema from {commit['file_key']}: {e}")
-                continue
+        commits = timeline[::-1]  # Start from latest
+        
+        # The latest commit almost always has the schema; one GET is enough
+        fields = self._read_commit_schema(bucket, commits[0])
+        if fields is not None:
+            return fields
+        
+        older = commits[1:]
+        if older:
+            workers = min(SCHEMA_SEARCH_BATCH_SIZE, len(older))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for start in range(0, len(older), SCHEMA_SEARCH_BATCH_SIZE):
+                    batch = older[start:start + SCHEMA_SEARCH_BATCH_SIZE]
+                    # map() yields in submission order, i.e. newest commit first
+                    for fields in executor.map(
+                        lambda commit: self._read_commit_schema(bucket, commit), batch
+                    ):
+                        if fields is not None:
+                            return fields
         
         logger.warning("Could not extract schema from any commit file")
         return []
     
+    def _read_commit_schema(self, bucket: str, commit: Dict) -> Optional[List[Dict]]:
+        """
+        Read the schema fields recorded in one commit file.
+        
+        Args:
+            bucket: S3 bucket name
+            commit: Timeline entry for the commit
+            
+        Returns:
+            List of field dictionaries, or None if the commit has no
+            readable schema
+        """
+        try:
+            if ijson is not None:
+                schema = self._stream_commit_schema(bucket, commit['file_key'])
+            else:
+                commit_data = orjson.loads(self._read_s3_object(bucket, commit['file_key']))
+                schema = commit_data.get("metadata", {}).get("schema")
+            
+            if isinstance(schema, str):
+                schema = orjson.loads(schema)
+            
+            if isinstance(schema, dict) and "fields" in schema:
+                return schema["fields"]
+            
+        except (*COMMIT_JSON_ERRORS, KeyError, ClientError, MetadataReadError) as e:
+            logger.debug("Could not extract schema from %s: %s", commit['file_key'], e)
+        
+        return None
+    
+    def _stream_commit_schema(self, bucket: str, key: str) -> Optional[Union[str, Dict]]:
+        """
+        Stream a commit file and pull out only its "metadata.schema" value.
+        
+        Commit files for large writes can be tens of MB of per-file write
+        stats; parsing incrementally from the response body keeps memory
+        bounded by the schema and stops downloading once it is found.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Commit file key
+            
+        Returns:
+            The schema as stored (usually an embedded JSON string), or None
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            raise MetadataReadError(
+                f"Failed to read S3 object s3://{bucket}/{key}: {str(e)}",
+                details={"bucket": bucket, "key": key, "error": str(e)}
+            )
+        
+        body = response['Body']
+        try:
+            return next(ijson.items(body, 'metadata.schema', use_float=True), None)
+        finally:
+            body.close()
+    
     def _extract_partition_fields(self, properties: Dict[str, str]) -> List[str]:
         """
         Extract partition field names from Hudi properties.
@@ -279,12 +435,11 @@ class HudiReader:
         
         return []
     
-    def _read_s3_object(self, bucket: str, key: str) -> str:
-        """Read content from S3 object."""
+    def _read_s3_object(self, bucket: str, key: str) -> bytes:
+        """Read the raw content of an S3 object."""
         try:
             response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            return content
+            return response['Body'].read()
         except ClientError as e:
             raise MetadataReadError(
                 f"Failed to read S3 object s3://{bucket}/{key}: {str(e)}",
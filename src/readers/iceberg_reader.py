@@ -5,16 +5,43 @@ Reads and parses Apache Iceberg table metadata from S3.
 Returns raw metadata without normalization.
 """
 
-import json
-import boto3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Optional, List
+
+import orjson
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 
 from ..utils.logger import setup_logger
+from ..utils.s3_utils import get_s3_client, parse_table_path
 from ..utils.exceptions import MetadataReadError
 
 logger = setup_logger(__name__)
 
+# Total size of metadata file bodies kept for conditional GETs (least
+# recently used evicted); a single Iceberg metadata file can be several MB
+METADATA_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Tables read concurrently by read_many; each read is a few S3 round-trips,
+# and around 16 requests in flight is where S3 throughput levels off
+READ_MANY_MAX_WORKERS = 16
+
+
+def _metadata_file_order(obj: Dict) -> tuple:
+    """
+    Sort key for listed metadata files: version number, then LastModified.
+    
+    Iceberg names metadata files vN.metadata.json (Hadoop tables) or
+    NNNNN-<uuid>.metadata.json (catalog tables); the version parsed from
+    the name orders commits exactly, and LastModified breaks ties and
+    orders files that follow neither convention.
+    """
+    stem = obj['Key'].rpartition('/')[2].partition('.')[0]
+    version = stem.removeprefix('v').partition('-')[0]
+    return (int(version) if version.isdigit() else -1, obj['LastModified'])
+
 
 class IcebergReader:
     """
@@ -26,7 +53,8 @@ class IcebergReader:
     
     def __init__(self, aws_access_key_id: Optional[str] = None,
                  aws_secret_access_key: Optional[str] = None,
-                 region_name: str = "us-east-1"):
+                 region_name: str = "us-east-1",
+                 s3_client: Optional[BaseClient] = None):
         """
         Initialize the Iceberg metadata reader.
         
@@ -34,14 +62,19 @@ class IcebergReader:
             aws_access_key_id: AWS access key (optional)
             aws_secret_access_key: AWS secret key (optional)
             region_name: AWS region name
+            s3_client: Existing S3 client to use instead of looking one up
+                from the credentials (lets callers share one connection pool)
         """
-        self.s3_client = boto3.client(
-            's3',
+        self.s3_client = s3_client or get_s3_client(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name
         )
-        logger.info("IcebergReader initialized")
+        # (bucket, key) -> (ETag, raw metadata file content)
+        self._metadata_cache: OrderedDict = OrderedDict()
+        self._metadata_cache_bytes = 0
+        self._metadata_cache_lock = threading.Lock()
+        logger.debug("IcebergReader initialized")
     
     def read_metadata(self, s3_path: str) -> Dict:
         """
@@ -62,17 +95,14 @@ class IcebergReader:
         Raises:
             MetadataReadError: If metadata cannot be read
         """
-        logger.info(f"Reading Iceberg metadata from: {s3_path}")
+        logger.debug("Reading Iceberg metadata from: %s", s3_path)
         
         try:
             bucket, prefix = self._parse_s3_path(s3_path)
             
-            # Get the latest metadata file
-            metadata_file = self._get_latest_metadata_file(bucket, prefix)
-            
-            # Read and parse metadata JSON
-            metadata_content = self._read_s3_object(bucket, metadata_file)
-            metadata = json.loads(metadata_content)
+            # Read the latest metadata file and parse it (orjson parses the raw bytes)
+            metadata_file, metadata_content = self._read_latest_metadata(bucket, prefix)
+            metadata = orjson.loads(metadata_content)
             
             # Extract key information
             raw_metadata = {
@@ -88,8 +118,8 @@ class IcebergReader:
                 "metadata_file": metadata_file
             }
             
-            logger.info(f"Successfully read Iceberg metadata: {len(raw_metadata['schema'])} columns, "
-                       f"{len(raw_metadata['snapshots'])} snapshots")
+            logger.debug("Successfully read Iceberg metadata: %d columns, %d snapshots",
+                         len(raw_metadata['schema']), len(raw_metadata['snapshots']))
             
             return raw_metadata
             
@@ -101,26 +131,68 @@ class IcebergReader:
                 details={"path": s3_path, "error": str(e)}
             )
     
-    def _parse_s3_path(self, s3_path: str) -> tuple[str, str]:
-        """Parse S3 path into bucket and prefix."""
-        if not s3_path.startswith("s3://"):
-            raise MetadataReadError(f"Invalid S3 path format: {s3_path}")
+    def read_many(self, s3_paths: List[str],
+                  max_workers: int = READ_MANY_MAX_WORKERS) -> List[Dict]:
+        """
+        Read metadata for several Iceberg tables concurrently.
+        
+        Each read is a short chain of dependent S3 requests, so tables are
+        read on a thread pool sharing the reader's S3 client and its
+        keep-alive connections.
+        
+        Args:
+            s3_paths: S3 paths to the Iceberg tables
+            max_workers: Number of tables read at once
+            
+        Returns:
+            Raw metadata dictionaries, in the order of s3_paths
+            
+        Raises:
+            MetadataReadError: If any table fails; details map each failed
+                path to its error and list the paths that succeeded
+        """
+        workers = min(max_workers, len(s3_paths)) or 1
+        results: Dict[str, Dict] = {}
+        failures: Dict[str, str] = {}
         
-        path_parts = s3_path.replace("s3://", "").split("/", 1)
-        bucket = path_parts[0]
-        prefix = path_parts[1] if len(path_parts) > 1 else ""
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.read_metadata, s3_path): s3_path
+                for s3_path in s3_paths
+            }
+            for future in as_completed(futures):
+                s3_path = futures[future]
+                try:
+                    results[s3_path] = future.result()
+                except MetadataReadError as e:
+                    failures[s3_path] = e.message
         
-        if prefix and not prefix.endswith("/"):
-            prefix += "/"
+        if failures:
+            raise MetadataReadError(
+                f"Failed to read Iceberg metadata for {len(failures)} of {len(s3_paths)} tables",
+                details={
+                    "failures": failures,
+                    "succeeded": [path for path in s3_paths if path in results]
+                }
+            )
         
-        return bucket, prefix
+        return [results[s3_path] for s3_path in s3_paths]
     
-    def _get_latest_metadata_file(self, bucket: str, prefix: str) -> str:
+    def _parse_s3_path(self, s3_path: str) -> tuple[str, str]:
+        """Parse S3 path into bucket and prefix."""
+        parsed = parse_table_path(s3_path)
+        if parsed is None:
+            raise MetadataReadError(f"Invalid S3 path format: {s3_path}")
+        return parsed
+    
+    def _read_latest_metadata(self, bucket: str, prefix: str) -> tuple[str, bytes]:
         """
-        Get the path to the latest Iceberg metadata file.
+        Locate and read the latest Iceberg metadata file.
         
         Tries multiple approaches:
-        1. Read version-hint.text
+        1. Read version-hint.text and GET the file it names directly; a
+           missing file (stale hint) is detected by that GET, so no
+           separate HEAD round-trip is spent verifying it
         2. Find latest metadata JSON by timestamp
         
         Args:
@@ -128,68 +200,155 @@ class IcebergReader:
             prefix: Table prefix
             
         Returns:
-            S3 key to the latest metadata file
+            Tuple of (S3 key of the latest metadata file, its raw content)
         """
         metadata_prefix = f"{prefix}metadata/"
         
-        # Try version-hint.text first
-        try:
-            version_hint_key = f"{metadata_prefix}version-hint.text"
-            version_hint = self._read_s3_object(bucket, version_hint_key).strip()
-            metadata_file = f"{metadata_prefix}{version_hint}"
-            
-            # Verify the file exists
-            self.s3_client.head_object(Bucket=bucket, Key=metadata_file)
-            logger.debug(f"Found metadata file via version-hint: {metadata_file}")
-            return metadata_file
-            
-        except ClientError:
-            logger.debug("version-hint.text not found, searching for latest metadata file")
+        version_hint = self._read_optional_object(bucket, f"{metadata_prefix}version-hint.text")
+        if version_hint is not None:
+            metadata_file = f"{metadata_prefix}{version_hint.decode('utf-8').strip()}"
+            content = self._read_metadata_file(bucket, metadata_file)
+            if content is not None:
+                logger.debug("Found metadata file via version-hint: %s", metadata_file)
+                return metadata_file, content
+            logger.debug("version-hint.text names missing file %s", metadata_file)
+        
+        logger.debug("No usable version-hint.text, searching for latest metadata file")
+        metadata_file = self._find_latest_metadata_file(bucket, metadata_prefix)
+        content = self._read_metadata_file(bucket, metadata_file)
+        if content is None:
+            raise MetadataReadError(
+                f"Metadata file disappeared while reading: s3://{bucket}/{metadata_file}",
+                details={"bucket": bucket, "key": metadata_file}
+            )
+        return metadata_file, content
+    
+    def _find_latest_metadata_file(self, bucket: str, metadata_prefix: str) -> str:
+        """
+        Find the newest .metadata.json file by listing the metadata/ directory.
         
-        # Fallback: Find latest metadata JSON by listing
+        Args:
+            bucket: S3 bucket name
+            metadata_prefix: Prefix of the metadata/ directory
+            
+        Returns:
+            S3 key to the latest metadata file
+        """
+        # Fallback: Find latest metadata JSON by listing. Pages are streamed
+        # through a single max() so the listing is never collected or
+        # sorted; the delimiter keeps nested directories out of it.
         try:
-            response = self.s3_client.list_objects_v2(
+            pages = self.s3_client.get_paginator('list_objects_v2').paginate(
                 Bucket=bucket,
-                Prefix=metadata_prefix
+                Prefix=metadata_prefix,
+                Delimiter='/'
+            )
+            latest_file = max(
+                (
+                    obj for page in pages for obj in page.get('Contents', [])
+                    if obj['Key'].endswith('.metadata.json')
+                ),
+                key=_metadata_file_order,
+                default=None
             )
-            
-            if 'Contents' not in response:
-                raise MetadataReadError(
-                    f"No metadata files found in {metadata_prefix}",
-                    details={"bucket": bucket, "prefix": metadata_prefix}
-                )
-            
-            # Filter for .metadata.json files and get the latest
-            metadata_files = [
-                obj for obj in response['Contents']
-                if obj['Key'].endswith('.metadata.json')
-            ]
-            
-            if not metadata_files:
-                raise MetadataReadError(
-                    f"No .metadata.json files found in {metadata_prefix}",
-                    details={"bucket": bucket, "prefix": metadata_prefix}
-                )
-            
-            # Sort by last modified and get the latest
-            latest_file = sorted(metadata_files, key=lambda x: x['LastModified'], reverse=True)[0]
-            logger.debug(f"Found latest metadata file: {latest_file['Key']}")
-            
-            return latest_file['Key']
-            
         except ClientError as e:
             raise MetadataReadError(
                 f"Failed to list metadata files: {str(e)}",
                 details={"bucket": bucket, "prefix": metadata_prefix, "error": str(e)}
             )
+        
+        if latest_file is None:
+            raise MetadataReadError(
+                f"No .metadata.json files found in {metadata_prefix}",
+                details={"bucket": bucket, "prefix": metadata_prefix}
+            )
+        
+        logger.debug("Found latest metadata file: %s", latest_file['Key'])
+        return latest_file['Key']
+    
+    def _read_metadata_file(self, bucket: str, key: str) -> Optional[bytes]:
+        """
+        Read a metadata file, revalidating any cached copy by ETag.
+        
+        Refreshes usually land on the same metadata file again, so the body
+        is cached with its ETag and later reads are conditional GETs
+        (If-None-Match) that transfer no body while it is unchanged.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Metadata file key
+            
+        Returns:
+            The raw content, or None if the file does not exist
+            
+        Raises:
+            MetadataReadError: For any other S3 error
+        """
+        cache_key = (bucket, key)
+        with self._metadata_cache_lock:
+            cached = self._metadata_cache.get(cache_key)
+        
+        get_kwargs = {"Bucket": bucket, "Key": key}
+        if cached is not None:
+            get_kwargs["IfNoneMatch"] = cached[0]
+        
+        try:
+            response = self.s3_client.get_object(**get_kwargs)
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if cached is not None and error_code in ('304', 'NotModified'):
+                logger.debug("Metadata file unchanged at s3://%s/%s", bucket, key)
+                with self._metadata_cache_lock:
+                    if cache_key in self._metadata_cache:
+                        self._metadata_cache.move_to_end(cache_key)
+                return cached[1]
+            if error_code in ('NoSuchKey', '404'):
+                return None
+            raise MetadataReadError(
+                f"Failed to read S3 object s3://{bucket}/{key}: {str(e)}",
+                details={"bucket": bucket, "key": key, "error": str(e)}
+            )
+        
+        content = response['Body'].read()
+        self._cache_metadata_file(cache_key, response['ETag'], content)
+        return content
+    
+    def _cache_metadata_file(self, cache_key: tuple, etag: str, content: bytes) -> None:
+        """
+        Remember a metadata file's content and ETag.
+        
+        Evicts least recently used entries until the cache fits in
+        METADATA_CACHE_MAX_BYTES; a file larger than that is not cached.
+        """
+        with self._metadata_cache_lock:
+            previous = self._metadata_cache.pop(cache_key, None)
+            if previous is not None:
+                self._metadata_cache_bytes -= len(previous[1])
+            if len(content) > METADATA_CACHE_MAX_BYTES:
+                return
+            
+            self._metadata_cache[cache_key] = (etag, content)
+            self._metadata_cache_bytes += len(content)
+            while self._metadata_cache_bytes > METADATA_CACHE_MAX_BYTES:
+                _, (_, evicted) = self._metadata_cache.popitem(last=False)
+                self._metadata_cache_bytes -= len(evicted)
     
-    def _read_s3_object(self, bucket: str, key: str) -> str:
-        """Read content from S3 object."""
+    def _read_optional_object(self, bucket: str, key: str) -> Optional[bytes]:
+        """
+        Read an S3 object that may legitimately be absent.
+        
+        Returns:
+            The raw content, or None if the object does not exist
+            
+        Raises:
+            MetadataReadError: For any other S3 error
+        """
         try:
             response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            return content
+            return response['Body'].read()
         except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return None
             raise MetadataReadError(
                 f"Failed to read S3 object s3://{bucket}/{key}: {str(e)}",
                 details={"bucket": bucket, "key": key, "error": str(e)}
@@ -210,35 +369,42 @@ class IcebergReader:
         # Handle both current-schema-id and schema formats
         if "fields" in schema:
             return schema["fields"]
-        elif "schemas" in metadata:
-            # Multiple schemas, get current one
-            current_schema_id = metadata.get("current-schema-id", 0)
-            for schema_entry in metadata["schemas"]:
-                if schema_entry.get("schema-id") == current_schema_id:
-                    return schema_entry.get("fields", [])
-        
-        return []
+        
+        # Multiple schemas, get current one
+        current = self._find_by_id(
+            metadata.get("schemas", ()), "schema-id", metadata.get("current-schema-id", 0)
+        )
+        return current.get("fields", []) if current else []
     
     def _extract_partition_spec(self, metadata: Dict) -> List[Dict]:
         """
         Extract partition specification from Iceberg metadata.
         
+        Format v2 metadata only has partition-specs, so the default spec is
+        looked up there first; the v1 partition-spec list is the fallback.
+        
         Args:
             metadata: Parsed Iceberg metadata JSON
             
         Returns:
             List of partition field specifications
         """
-        partition_spec = metadata.get("partition-spec", [])
-        
-        # Handle both direct partition-spec and partition-specs array
-        if isinstance(partition_spec, list):
-            return partition_spec
-        elif "partition-specs" in metadata:
+        if "partition-specs" in metadata:
             # Multiple specs, get the default one
-            default_spec_id = metadata.get("default-spec-id", 0)
-            for spec in metadata["partition-specs"]:
-                if spec.get("spec-id") == default_spec_id:
-                    return spec.get("fields", [])
+            default_spec = self._find_by_id(
+                metadata["partition-specs"], "spec-id", metadata.get("default-spec-id", 0)
+            )
+            if default_spec is not None:
+                return default_spec.get("fields", [])
+        
+        partition_spec = metadata.get("partition-spec", [])
+        return partition_spec if isinstance(partition_spec, list) else []
+    
+    def _find_by_id(self, entries: List[Dict], id_key: str, wanted: int) -> Optional[Dict]:
+        """
+        Return the first entry whose id_key equals wanted, or None.
         
-        return []
+        Stops at the match instead of scanning the rest of the list, which
+        for long-lived tables can hold hundreds of historical schemas.
+        """
+        return next((entry for entry in entries if entry.get(id_key) == wanted), None)
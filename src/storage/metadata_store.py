@@ -5,18 +5,109 @@ Provides persistence layer for TableMetadata using SQLite.
 Designed to be easily migrated to PostgreSQL in production.
 """
 
+import os
+import queue
 import sqlite3
-import json
-from typing import Optional, List
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional, List, Union
 from pathlib import Path
 from datetime import datetime
 
-from ..models.table_metadata import TableMetadata
+import orjson
+
+from config.settings import DEFAULT_SQLITE_PRAGMAS
+
+from ..models.table_metadata import ColumnMetadata, TableMetadata
 from ..utils.logger import setup_logger
 from ..utils.exceptions import StorageError
 
 logger = setup_logger(__name__)
 
+# PRAGMAs that change database-wide or write behaviour; read-only
+# connections skip them
+_WRITE_ONLY_PRAGMAS = {"journal_mode", "synchronous"}
+
+# Table names fetched per round by iter_tables
+LIST_TABLES_BATCH_SIZE = 1000
+
+# Statements run on every save
+_SQL_INSERT_TABLE = """
+    INSERT INTO table_metadata (
+        table_name, format, location, partitions, properties,
+        supports_time_travel, num_files, size_bytes, row_count,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_TABLE = """
+    UPDATE table_metadata SET
+        format = ?,
+        location = ?,
+        partitions = ?,
+        properties = ?,
+        supports_time_travel = ?,
+        num_files = ?,
+        size_bytes = ?,
+        row_count = ?,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+# Same insert for batches: an existing table keeps created_at and gets the
+# trailing parameter as updated_at, like _SQL_UPDATE_TABLE
+_SQL_UPSERT_TABLE = _SQL_INSERT_TABLE + """
+    ON CONFLICT (table_name) DO UPDATE SET
+        format = excluded.format,
+        location = excluded.location,
+        partitions = excluded.partitions,
+        properties = excluded.properties,
+        supports_time_travel = excluded.supports_time_travel,
+        num_files = excluded.num_files,
+        size_bytes = excluded.size_bytes,
+        row_count = excluded.row_count,
+        updated_at = ?
+"""
+
+_SQL_INSERT_COLUMN = """
+    INSERT INTO column_metadata (
+        table_id, column_name, data_type, nullable, comment, column_order
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_COLUMN = _SQL_INSERT_COLUMN + """
+    ON CONFLICT (table_id, column_name) DO UPDATE SET
+        data_type = excluded.data_type,
+        nullable = excluded.nullable,
+        comment = excluded.comment,
+        column_order = excluded.column_order
+"""
+
+# Tables joined with their columns; callers append WHERE / ORDER BY
+_SQL_SELECT_TABLES_WITH_COLUMNS = """
+    SELECT t.*, c.column_name, c.data_type, c.nullable, c.comment
+    FROM table_metadata t
+    LEFT JOIN column_metadata c ON c.table_id = t.id
+"""
+
+# Column names are bound as one JSON array so the statement does not
+# depend on SQLite's bound-parameter limit
+_SQL_DELETE_REMOVED_COLUMNS = """
+    DELETE FROM column_metadata
+    WHERE table_id = ?
+      AND column_name NOT IN (SELECT value FROM json_each(?))
+"""
+
+
+def _dumps_text(value) -> str:
+    """
+    Serialize a value to JSON text for a TEXT column.
+    
+    orjson is several times faster than json.dumps; its output is decoded
+    so existing databases keep storing (and comparing) text, not blobs.
+    """
+    return orjson.dumps(value).decode()
+
 
 class MetadataStore:
     """
@@ -24,76 +115,98 @@ class MetadataStore:
     
     Uses SQLite for local development, with schema designed
     for easy migration to PostgreSQL for production.
+    
+    Writes go through a single persistent connection serialized by a lock;
+    reads use a pool of read-only connections so they run concurrently
+    with each other and, under WAL, with the writer.
     """
     
-    def __init__(self, db_path: str = "metadata.db"):
+    def __init__(self, db_path: str = "metadata.db",
+                 pragmas: Optional[Mapping[str, Union[str, int]]] = None,
+                 read_pool_size: Optional[int] = None):
         """
         Initialize metadata store.
         
         Args:
             db_path: Path to SQLite database file
+            pragmas: SQLite PRAGMAs to apply on every connection
+                (defaults to DEFAULT_SQLITE_PRAGMAS from config.settings)
+            read_pool_size: Maximum number of read-only connections
+                (defaults to twice the CPU count)
         """
         self.db_path = db_path
+        self.pragmas = DEFAULT_SQLITE_PRAGMAS if pragmas is None else pragmas
+        
+        self._write_conn = self._get_connection()
+        self._write_lock = threading.Lock()
+        
+        self._read_pool_size = read_pool_size or 2 * (os.cpu_count() or 1)
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._read_conns_opened = 0
+        self._read_pool_lock = threading.Lock()
+        
         self._initialize_database()
-        logger.info(f"MetadataStore initialized with database: {db_path}")
+        logger.info("MetadataStore initialized with database: %s", db_path)
     
     def _initialize_database(self):
         """Create database schema if it doesn't exist."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Main table metadata table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS table_metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    table_name TEXT NOT NULL UNIQUE,
-                    format TEXT NOT NULL,
-                    location TEXT NOT NULL,
-                    partitions TEXT,
-                    properties TEXT,
-                    supports_time_travel BOOLEAN NOT NULL DEFAULT 0,
-                    num_files INTEGER,
-                    size_bytes INTEGER,
-                    row_count INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Column metadata table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS column_metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    table_id INTEGER NOT NULL,
-                    column_name TEXT NOT NULL,
-                    data_type TEXT NOT NULL,
-                    nullable BOOLEAN NOT NULL DEFAULT 1,
-                    comment TEXT,
-                    column_order INTEGER NOT NULL,
-                    FOREIGN KEY (table_id) REFERENCES table_metadata (id) ON DELETE CASCADE,
-                    UNIQUE(table_id, column_name)
-                )
-            """)
-            
-            # Index for faster lookups
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_table_name 
-                ON table_metadata(table_name)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_format 
-                ON table_metadata(format)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_table_id 
-                ON column_metadata(table_id)
-            """)
-            
-            conn.commit()
-            conn.close()
+            with self._write_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Main table metadata table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS table_metadata (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        table_name TEXT NOT NULL UNIQUE,
+                        format TEXT NOT NULL,
+                        location TEXT NOT NULL,
+                        partitions TEXT,
+                        properties TEXT,
+                        supports_time_travel BOOLEAN NOT NULL DEFAULT 0,
+                        num_files INTEGER,
+                        size_bytes INTEGER,
+                        row_count INTEGER,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                # Column metadata table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS column_metadata (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        table_id INTEGER NOT NULL,
+                        column_name TEXT NOT NULL,
+                        data_type TEXT NOT NULL,
+                        nullable BOOLEAN NOT NULL DEFAULT 1,
+                        comment TEXT,
+                        column_order INTEGER NOT NULL,
+                        FOREIGN KEY (table_id) REFERENCES table_metadata (id) ON DELETE CASCADE,
+                        UNIQUE(table_id, column_name)
+                    )
+                """)
+                
+                # Index for faster lookups
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_table_name 
+                    ON table_metadata(table_name)
+                """)
+                
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_format 
+                    ON table_metadata(format)
+                """)
+                
+                # Serves the ordered column lookup of the table/column join;
+                # it also covers plain table_id lookups, so the older
+                # single-column index is dropped
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_table_id_order
+                    ON column_metadata(table_id, column_order)
+                """)
+                
+                cursor.execute("DROP INDEX IF EXISTS idx_table_id")
             
             logger.debug("Database schema initialized successfully")
             
@@ -103,13 +216,32 @@ class MetadataStore:
                 details={"db_path": self.db_path, "error": str(e)}
             )
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
+    def _get_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a database connection.
+        
+        Connections are shared across the API's worker threads (one at a
+        time), so they are opened with check_same_thread=False.
+        
+        Args:
+            read_only: Open the database with mode=ro
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
+            if read_only:
+                uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            else:
+                # Autocommit mode: _write_connection issues BEGIN IMMEDIATE
+                # and COMMIT itself
+                conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                       isolation_level=None)
             conn.row_factory = sqlite3.Row  # Enable column access by name
             # Enable foreign key constraints
             conn.execute("PRAGMA foreign_keys = ON")
+            for name, value in self.pragmas.items():
+                if read_only and name in _WRITE_ONLY_PRAGMAS:
+                    continue
+                conn.execute(f"PRAGMA {name} = {value}")
             return conn
         except sqlite3.Error as e:
             raise StorageError(
@@ -117,6 +249,79 @@ class MetadataStore:
                 details={"db_path": self.db_path, "error": str(e)}
             )
     
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the shared write connection for one transaction.
+        
+        The transaction starts with BEGIN IMMEDIATE, taking SQLite's write
+        lock up front rather than upgrading from a read lock mid-transaction
+        (which can fail with SQLITE_BUSY). Commits when the block exits
+        normally and rolls back on error.
+        """
+        with self._write_lock:
+            self._write_conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._write_conn
+                self._write_conn.execute("COMMIT")
+            except BaseException:
+                # Some errors (e.g. SQLITE_FULL) already rolled back
+                if self._write_conn.in_transaction:
+                    self._write_conn.execute("ROLLBACK")
+                raise
+    
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read-only connection from the pool.
+        
+        Connections are opened lazily up to the pool size; once all are in
+        use, callers wait for one to be returned.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            with self._read_pool_lock:
+                can_open = self._read_conns_opened < self._read_pool_size
+                if can_open:
+                    self._read_conns_opened += 1
+            if can_open:
+                try:
+                    conn = self._get_connection(read_only=True)
+                except StorageError:
+                    with self._read_pool_lock:
+                        self._read_conns_opened -= 1
+                    raise
+            else:
+                conn = self._read_pool.get()
+        
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def close(self) -> None:
+        """
+        Close the write connection and every pooled read connection.
+        
+        Call once no requests are in flight: read connections that are
+        borrowed at that moment are returned to the pool but not closed.
+        """
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._read_pool_lock:
+            self._read_conns_opened = 0
+        
+        # Closed last: the final connection to close checkpoints the WAL
+        # and removes it, which a read-only connection cannot do
+        with self._write_lock:
+            self._write_conn.close()
+        
+        logger.info("MetadataStore closed: %s", self.db_path)
+    
     def save_table_metadata(self, metadata: TableMetadata) -> int:
         """
         Save or update table metadata.
@@ -130,54 +335,134 @@ class MetadataStore:
         Raises:
             StorageError: If save operation fails
         """
-        logger.info(f"Saving metadata for table: {metadata.table_name}")
+        logger.debug("Saving metadata for table: %s", metadata.table_name)
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._write_connection() as conn:
+                table_id = self._save_table_metadata(conn.cursor(), metadata)
+            
+            logger.debug("Successfully saved metadata for table: %s (id=%s)", metadata.table_name, table_id)
+            return table_id
             
-            # Check if table already exists
-            cursor.execute(
-                "SELECT id FROM table_metadata WHERE table_name = ?",
-                (metadata.table_name,)
+        except sqlite3.Error as e:
+            raise StorageError(
+                f"Failed to save table metadata: {str(e)}",
+                details={"table_name": metadata.table_name, "error": str(e)}
             )
-            existing = cursor.fetchone()
+    
+    def save_table_metadata_many(self, metadata_list: List[TableMetadata]) -> List[int]:
+        """
+        Save or update several tables in a single transaction.
+        
+        One commit (and so one WAL sync) covers the whole batch, which is
+        what dominates when storing many tables one by one. Each step runs
+        as one statement or executemany over the whole batch: upsert the
+        tables, look up their ids, upsert their columns, then drop columns
+        that left each schema.
+        
+        Args:
+            metadata_list: TableMetadata objects to persist
             
-            if existing:
-                # Update existing table
-                table_id = existing[0]
-                self._update_table_metadata(cursor, table_id, metadata)
-            else:
-                # Insert new table
-                table_id = self._insert_table_metadata(cursor, metadata)
+        Returns:
+            Table IDs, in the order of metadata_list
             
-            conn.commit()
-            conn.close()
+        Raises:
+            StorageError: If the save fails; nothing from the batch is stored
+        """
+        logger.debug("Saving metadata for %d table(s)", len(metadata_list))
+        
+        try:
+            with self._write_connection() as conn:
+                table_ids = self._save_table_metadata_batch(conn.cursor(), metadata_list)
             
-            logger.info(f"Successfully saved metadata for table: {metadata.table_name} (id={table_id})")
-            return table_id
+            logger.debug("Successfully saved metadata for %d table(s)", len(table_ids))
+            return table_ids
             
         except sqlite3.Error as e:
             raise StorageError(
                 f"Failed to save table metadata: {str(e)}",
-                details={"table_name": metadata.table_name, "error": str(e)}
+                details={
+                    "table_names": [metadata.table_name for metadata in metadata_list],
+                    "error": str(e)
+                }
+            )
+    
+    def _save_table_metadata_batch(self, cursor: sqlite3.Cursor,
+                                   metadata_list: List[TableMetadata]) -> List[int]:
+        """Insert or update a batch of tables within the caller's transaction."""
+        # A table listed twice is saved once, with its last entry winning as
+        # if the batch had been saved one table at a time
+        latest = list({metadata.table_name: metadata for metadata in metadata_list}.values())
+        
+        now = datetime.now()
+        cursor.executemany(_SQL_UPSERT_TABLE, [
+            (
+                metadata.table_name,
+                metadata.format,
+                metadata.location,
+                _dumps_text(metadata.partitions),
+                _dumps_text(metadata.properties),
+                metadata.supports_time_travel,
+                metadata.num_files,
+                metadata.size_bytes,
+                metadata.row_count,
+                metadata.created_at or now,
+                metadata.updated_at or now,
+                now
             )
+            for metadata in latest
+        ])
+        
+        cursor.execute(
+            "SELECT table_name, id FROM table_metadata "
+            "WHERE table_name IN (SELECT value FROM json_each(?))",
+            (_dumps_text([metadata.table_name for metadata in latest]),)
+        )
+        ids_by_name = dict(cursor.fetchall())
+        
+        cursor.executemany(_SQL_UPSERT_COLUMN, [
+            (ids_by_name[metadata.table_name], column.name, column.data_type,
+             column.nullable, column.comment, idx)
+            for metadata in latest
+            for idx, column in enumerate(metadata.columns)
+        ])
+        cursor.executemany(_SQL_DELETE_REMOVED_COLUMNS, [
+            (ids_by_name[metadata.table_name],
+             _dumps_text([column.name for column in metadata.columns]))
+            for metadata in latest
+        ])
+        
+        return [ids_by_name[metadata.table_name] for metadata in metadata_list]
+    
+    def _save_table_metadata(self, cursor: sqlite3.Cursor,
+                             metadata: TableMetadata) -> int:
+        """Insert or update one table within the caller's transaction."""
+        # Check if table already exists
+        cursor.execute(
+            "SELECT id FROM table_metadata WHERE table_name = ?",
+            (metadata.table_name,)
+        )
+        existing = cursor.fetchone()
+        
+        if existing:
+            # Update existing table
+            table_id = existing[0]
+            self._update_table_metadata(cursor, table_id, metadata)
+        else:
+            # Insert new table
+            table_id = self._insert_table_metadata(cursor, metadata)
+        
+        return table_id
     
     def _insert_table_metadata(self, cursor: sqlite3.Cursor, 
                               metadata: TableMetadata) -> int:
         """Insert new table metadata."""
-        cursor.execute("""
-            INSERT INTO table_metadata (
-                table_name, format, location, partitions, properties,
-                supports_time_travel, num_files, size_bytes, row_count,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_SQL_INSERT_TABLE, (
             metadata.table_name,
             metadata.format,
             metadata.location,
-            json.dumps(metadata.partitions),
-            json.dumps(metadata.properties),
+            _dumps_text(metadata.partitions),
+            _dumps_text(metadata.properties),
             metadata.supports_time_travel,
             metadata.num_files,
             metadata.size_bytes,
@@ -188,43 +473,18 @@ class MetadataStore:
         
         table_id = cursor.lastrowid
         
-        # Insert columns
-        for idx, column in enumerate(metadata.columns):
-            cursor.execute("""
-                INSERT INTO column_metadata (
-                    table_id, column_name, data_type, nullable, comment, column_order
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                table_id,
-                column.name,
-                column.data_type,
-                column.nullable,
-                column.comment,
-                idx
-            ))
+        self._insert_columns(cursor, table_id, metadata)
         
         return table_id
     
     def _update_table_metadata(self, cursor: sqlite3.Cursor, 
                               table_id: int, metadata: TableMetadata):
         """Update existing table metadata."""
-        cursor.execute("""
-            UPDATE table_metadata SET
-                format = ?,
-                location = ?,
-                partitions = ?,
-                properties = ?,
-                supports_time_travel = ?,
-                num_files = ?,
-                size_bytes = ?,
-                row_count = ?,
-                updated_at = ?
-            WHERE id = ?
-        """, (
+        cursor.execute(_SQL_UPDATE_TABLE, (
             metadata.format,
             metadata.location,
-            json.dumps(metadata.partitions),
-            json.dumps(metadata.properties),
+            _dumps_text(metadata.partitions),
+            _dumps_text(metadata.properties),
             metadata.supports_time_travel,
             metadata.num_files,
             metadata.size_bytes,
@@ -233,22 +493,35 @@ class MetadataStore:
             table_id
         ))
         
-        # Delete old columns and insert new ones
-        cursor.execute("DELETE FROM column_metadata WHERE table_id = ?", (table_id,))
-        
-        for idx, column in enumerate(metadata.columns):
-            cursor.execute("""
-                INSERT INTO column_metadata (
-                    table_id, column_name, data_type, nullable, comment, column_order
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                table_id,
-                column.name,
-                column.data_type,
-                column.nullable,
-                column.comment,
-                idx
-            ))
+        self._upsert_columns(cursor, table_id, metadata)
+    
+    def _insert_columns(self, cursor: sqlite3.Cursor, table_id: int,
+                        metadata: TableMetadata):
+        """Insert all of a table's columns with one executemany call."""
+        cursor.executemany(_SQL_INSERT_COLUMN, [
+            (table_id, column.name, column.data_type, column.nullable, column.comment, idx)
+            for idx, column in enumerate(metadata.columns)
+        ])
+    
+    def _upsert_columns(self, cursor: sqlite3.Cursor, table_id: int,
+                        metadata: TableMetadata):
+        """
+        Bring an existing table's columns in line with metadata.
+        
+        Columns are upserted on (table_id, column_name), so unchanged
+        columns keep their rows and ids instead of being deleted and
+        re-inserted; columns no longer in the schema are then removed with
+        one statement.
+        """
+        cursor.executemany(_SQL_UPSERT_COLUMN, [
+            (table_id, column.name, column.data_type, column.nullable, column.comment, idx)
+            for idx, column in enumerate(metadata.columns)
+        ])
+        
+        cursor.execute(_SQL_DELETE_REMOVED_COLUMNS, (
+            table_id,
+            _dumps_text([column.name for column in metadata.columns])
+        ))
     
     def get_table_metadata(self, table_name: str) -> Optional[TableMetadata]:
         """
@@ -263,67 +536,32 @@ class MetadataStore:
         Raises:
             StorageError: If retrieval fails
         """
-        logger.debug(f"Retrieving metadata for table: {table_name}")
+        logger.debug("Retrieving metadata for table: %s", table_name)
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Get table metadata
-            cursor.execute(
-                "SELECT * FROM table_metadata WHERE table_name = ?",
-                (table_name,)
-            )
-            table_row = cursor.fetchone()
+            with self._read_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Table and columns in one query: every row repeats the
+                # table fields, plus one column (NULL if there are none)
+                cursor.execute(
+                    _SQL_SELECT_TABLES_WITH_COLUMNS
+                    + " WHERE t.table_name = ? ORDER BY c.column_order",
+                    (table_name,)
+                )
+                rows = cursor.fetchall()
             
-            if not table_row:
-                logger.debug(f"Table not found: {table_name}")
-                conn.close()
+            if not rows:
+                logger.debug("Table not found: %s", table_name)
                 return None
             
-            # Get column metadata
-            cursor.execute(
-                """
-                SELECT column_name, data_type, nullable, comment
-                FROM column_metadata
-                WHERE table_id = ?
-                ORDER BY column_order
-                """,
-                (table_row['id'],)
-            )
-            column_rows = cursor.fetchall()
-            
-            conn.close()
-            
-            # Build TableMetadata object
-            from ..models.table_metadata import ColumnMetadata
-            
             columns = [
-                ColumnMetadata(
-                    name=row['column_name'],
-                    data_type=row['data_type'],
-                    nullable=bool(row['nullable']),
-                    comment=row['comment']
-                )
-                for row in column_rows
+                self._row_to_column(row) for row in rows
+                if row['column_name'] is not None
             ]
+            metadata = self._row_to_table_metadata(rows[0], columns)
             
-            metadata = TableMetadata(
-                table_name=table_row['table_name'],
-                format=table_row['format'],
-                location=table_row['location'],
-                columns=columns,
-                partitions=json.loads(table_row['partitions']) if table_row['partitions'] else [],
-                properties=json.loads(table_row['properties']) if table_row['properties'] else {},
-                supports_time_travel=bool(table_row['supports_time_travel']),
-                created_at=datetime.fromisoformat(table_row['created_at']) if table_row['created_at'] else None,
-                updated_at=datetime.fromisoformat(table_row['updated_at']) if table_row['updated_at'] else None,
-                num_files=table_row['num_files'],
-                size_bytes=table_row['size_bytes'],
-                row_count=table_row['row_count']
-            )
-            
-            logger.debug(f"Retrieved metadata for table: {table_name}")
+            logger.debug("Retrieved metadata for table: %s", table_name)
             return metadata
             
         except sqlite3.Error as e:
@@ -345,26 +583,102 @@ class MetadataStore:
         Raises:
             StorageError: If listing fails
         """
-        logger.debug(f"Listing tables (format_filter={format_filter})")
+        logger.debug("Listing tables (format_filter=%s)", format_filter)
+        
+        tables = [name for batch in self.iter_tables(format_filter) for name in batch]
         
+        logger.debug("Found %d tables", len(tables))
+        return tables
+    
+    def iter_tables(self, format_filter: Optional[str] = None,
+                    batch_size: int = LIST_TABLES_BATCH_SIZE) -> Iterator[List[str]]:
+        """
+        Stream table names in batches, optionally filtered by format.
+        
+        Rows are fetched batch_size at a time as plain tuples (no
+        sqlite3.Row per name), so callers paging through a large catalog
+        never hold the whole result. A pooled read connection is held until
+        the generator is exhausted or closed.
+        
+        Args:
+            format_filter: Optional format to filter by ("ICEBERG", "DELTA", "HUDI")
+            batch_size: Number of names per yielded batch
+            
+        Yields:
+            Lists of table names, in name order
+            
+        Raises:
+            StorageError: If listing fails
+        """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                
+                if format_filter:
+                    cursor.execute(
+                        "SELECT table_name FROM table_metadata WHERE format = ? ORDER BY table_name",
+                        (format_filter,)
+                    )
+                else:
+                    cursor.execute("SELECT table_name FROM table_metadata ORDER BY table_name")
+                
+                while batch := cursor.fetchmany(batch_size):
+                    yield [row[0] for row in batch]
             
-            if format_filter:
-                cursor.execute(
-                    "SELECT table_name FROM table_metadata WHERE format = ? ORDER BY table_name",
-                    (format_filter,)
-                )
-            else:
-                cursor.execute("SELECT table_name FROM table_metadata ORDER BY table_name")
+        except sqlite3.Error as e:
+            raise StorageError(
+                f"Failed to list tables: {str(e)}",
+                details={"format_filter": format_filter, "error": str(e)}
+            )
+    
+    def list_tables_with_metadata(self, format_filter: Optional[str] = None) -> List[TableMetadata]:
+        """
+        List full metadata for all tables, optionally filtered by format.
+        
+        Tables and their columns are fetched with a single joined query
+        rather than one lookup per table.
+        
+        Args:
+            format_filter: Optional format to filter by ("ICEBERG", "DELTA", "HUDI")
             
-            tables = [row[0] for row in cursor.fetchall()]
+        Returns:
+            List of TableMetadata objects ordered by table name
             
-            conn.close()
+        Raises:
+            StorageError: If listing fails
+        """
+        logger.debug("Listing tables with metadata (format_filter=%s)", format_filter)
+        
+        query = _SQL_SELECT_TABLES_WITH_COLUMNS
+        params: tuple = ()
+        if format_filter:
+            query += " WHERE t.format = ?"
+            params = (format_filter,)
+        query += " ORDER BY t.table_name, c.column_order"
+        
+        try:
+            with self._read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+            
+            # Rows arrive grouped by table; collect each table's columns
+            tables: Dict[int, tuple] = {}
+            for row in rows:
+                entry = tables.get(row['id'])
+                if entry is None:
+                    entry = tables[row['id']] = (row, [])
+                if row['column_name'] is not None:
+                    entry[1].append(self._row_to_column(row))
+            
+            result = [
+                self._row_to_table_metadata(table_row, columns)
+                for table_row, columns in tables.values()
+            ]
             
-            logger.debug(f"Found {len(tables)} tables")
-            return tables
+            logger.debug("Found %d tables", len(result))
+            return result
             
         except sqlite3.Error as e:
             raise StorageError(
@@ -372,6 +686,33 @@ class MetadataStore:
                 details={"format_filter": format_filter, "error": str(e)}
             )
     
+    def _row_to_column(self, row: sqlite3.Row) -> ColumnMetadata:
+        """Build ColumnMetadata from a column_metadata row."""
+        return ColumnMetadata(
+            name=row['column_name'],
+            data_type=row['data_type'],
+            nullable=bool(row['nullable']),
+            comment=row['comment']
+        )
+    
+    def _row_to_table_metadata(self, table_row: sqlite3.Row,
+                               columns: List[ColumnMetadata]) -> TableMetadata:
+        """Build TableMetadata from a table_metadata row and its columns."""
+        return TableMetadata(
+            table_name=table_row['table_name'],
+            format=table_row['format'],
+            location=table_row['location'],
+            columns=columns,
+            partitions=orjson.loads(table_row['partitions']) if table_row['partitions'] else [],
+            properties=orjson.loads(table_row['properties']) if table_row['properties'] else {},
+            supports_time_travel=bool(table_row['supports_time_travel']),
+            created_at=datetime.fromisoformat(table_row['created_at']) if table_row['created_at'] else None,
+            updated_at=datetime.fromisoformat(table_row['updated_at']) if table_row['updated_at'] else None,
+            num_files=table_row['num_files'],
+            size_bytes=table_row['size_bytes'],
+            row_count=table_row['row_count']
+        )
+    
     def delete_table_metadata(self, table_name: str) -> bool:
         """
         Delete table metadata.
@@ -385,26 +726,23 @@ class MetadataStore:
         Raises:
             StorageError: If deletion fails
         """
-        logger.info(f"Deleting metadata for table: {table_name}")
+        logger.debug("Deleting metadata for table: %s", table_name)
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "DELETE FROM table_metadata WHERE table_name = ?",
-                (table_name,)
-            )
-            
-            deleted = cursor.rowcount > 0
-            
-            conn.commit()
-            conn.close()
+            with self._write_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(
+                    "DELETE FROM table_metadata WHERE table_name = ?",
+                    (table_name,)
+                )
+                
+                deleted = cursor.rowcount > 0
             
             if deleted:
-                logger.info(f"Deleted metadata for table: {table_name}")
+                logger.debug("Deleted metadata for table: %s", table_name)
             else:
-                logger.debug(f"Table not found for deletion: {table_name}")
+                logger.debug("Table not found for deletion: %s", table_name)
             
             return deleted
             
@@ -422,13 +760,11 @@ class MetadataStore:
             Number of tables
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM table_metadata")
-            count = cursor.fetchone()[0]
-            
-            conn.close()
+            with self._read_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT COUNT(*) FROM table_metadata")
+                count = cursor.fetchone()[0]
             
             return count
             
@@ -2,29 +2,46 @@
 
 
 class PlatformException(Exception):
-    """Base exception for all platform errors."""
+    """
+    Base exception for all platform errors.
+    
+    message and details live in slots rather than the instance __dict__,
+    which is then never allocated; subclasses declare empty __slots__ to
+    keep it that way.
+    """
+    
+    __slots__ = ("message", "details")
     
     def __init__(self, message: str, details: dict = None):
         super().__init__(message)
         self.message = message
         self.details = details or {}
+    
+    def __reduce__(self):
+        # Exception's default only carries args and __dict__, which would
+        # drop the slotted details when pickled (e.g. across processes)
+        return type(self), (self.message, self.details)
 
 
 class FormatDetectionError(PlatformException):
     """Raised when table format cannot be detected."""
-    pass
+    
+    __slots__ = ()
 
 
 class MetadataReadError(PlatformException):
     """Raised when metadata cannot be read from a table."""
-    pass
+    
+    __slots__ = ()
 
 
 class NormalizationError(PlatformException):
     """Raised when metadata normalization fails."""
-    pass
+    
+    __slots__ = ()
 
 
 class StorageError(PlatformException):
     """Raised when metadata storage operations fail."""
-    pass
+    
+    __slots__ = ()
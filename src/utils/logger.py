@@ -1,9 +1,35 @@
 """Logging configuration for the platform."""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# All console output goes through one queue drained by a background
+# listener thread, so request threads never block on stdout writes.
+_log_queue = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _get_queue_handler() -> QueueHandler:
+    """Start the shared console listener on first use and return a handler feeding it."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            ))
+            _listener = QueueListener(_log_queue, console_handler)
+            _listener.start()
+            atexit.register(_listener.stop)
+    return QueueHandler(_log_queue)
+
 
 def setup_logger(
     name: str,
@@ -28,20 +54,17 @@ def setup_logger(
     if logger.handlers:
         return logger
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Console handler (queued, written by the shared listener thread)
+    console_handler = _get_queue_handler()
     console_handler.setLevel(level)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
     # File handler (optional)
     if log_file:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
@@ -2,10 +2,101 @@
 S3 utilities for working with table paths and objects.
 """
 
-from typing import Tuple
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
+
 from ..utils.exceptions import PlatformException
 
+# Shared by every client so detection and metadata reads running in parallel
+# reuse warm keep-alive connections instead of each opening their own.
+# "adaptive" retries back off on throttling (503 SlowDown) and transient
+# errors instead of failing the discovery, and also rate-limit the shared
+# client once S3 starts throttling so parallel scans stop piling on retries.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "total_max_attempts": 5}
+)
+
+# s3://bucket[/key], with a valid bucket name and a key that does not start
+# with "/". Use with fullmatch(); group 1 is the bucket, group 2 the key.
+S3_PATH_PATTERN = re.compile(r's3://([a-z0-9][a-z0-9.\-]{1,61}[a-z0-9])(?:/((?!/).*))?')
+
+# Parsed paths remembered per process; discovery and every reader call
+# parse the same table paths over and over
+S3_PATH_CACHE_MAXSIZE = 8192
+
+_s3_clients: Dict[Tuple[Optional[str], Optional[str], str], BaseClient] = {}
+_s3_clients_lock = threading.Lock()
+
+
+def get_s3_client(aws_access_key_id: Optional[str] = None,
+                  aws_secret_access_key: Optional[str] = None,
+                  region_name: str = "us-east-1") -> BaseClient:
+    """
+    Return a process-wide S3 client for the given credentials and region.
+    
+    Building a boto3 client loads the service model and sets up a new
+    connection pool, so clients are created once per credential set and
+    shared. Each credential set gets its own boto3 Session, which is not
+    thread-safe to build clients from, hence the lock; the clients
+    themselves are thread-safe.
+    
+    Args:
+        aws_access_key_id: AWS access key (optional, uses env vars if not provided)
+        aws_secret_access_key: AWS secret key (optional, uses env vars if not provided)
+        region_name: AWS region name
+        
+    Returns:
+        boto3 S3 client
+    """
+    key = (aws_access_key_id, aws_secret_access_key, region_name)
+    with _s3_clients_lock:
+        client = _s3_clients.get(key)
+        if client is None:
+            session = boto3.session.Session(
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name
+            )
+            client = session.client('s3', config=S3_CLIENT_CONFIG)
+            _s3_clients[key] = client
+        return client
+
+
+@lru_cache(maxsize=S3_PATH_CACHE_MAXSIZE)
+def parse_table_path(s3_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a table path into bucket and directory prefix in a single match.
+    
+    Args:
+        s3_path: S3 path like s3://bucket/warehouse/table
+        
+    Returns:
+        Tuple of (bucket, prefix), where prefix is empty or ends with "/",
+        or None if the path is not a valid S3 path. Callers raise their own
+        error type for invalid paths.
+    """
+    match = S3_PATH_PATTERN.fullmatch(s3_path)
+    if match is None:
+        return None
+    
+    bucket, prefix = match.group(1), match.group(2) or ""
+    
+    # Ensure prefix ends with / for consistent directory checking
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+    
+    return bucket, prefix
+
 
+@lru_cache(maxsize=S3_PATH_CACHE_MAXSIZE)
 def parse_s3_uri(s3_uri: str) -> Tuple[str, str]:
     """
     Parse S3 URI into bucket and key.
@@ -22,13 +113,12 @@ def parse_s3_uri(s3_uri: str) -> Tuple[str, str]:
     if not s3_uri.startswith("s3://"):
         raise PlatformException(f"Invalid S3 URI format: {s3_uri}")
     
-    path = s3_uri[5:]  # Remove s3://
-    parts = path.split("/", 1)
-    
-    bucket = parts[0]
-    key = parts[1] if len(parts) > 1 else ""
-    
-    return bucket, key
+    # Slice around the first "/" after the scheme instead of building an
+    # intermediate string and a list with split
+    sep = s3_uri.find("/", 5)
+    if sep < 0:
+        return s3_uri[5:], ""
+    return s3_uri[5:sep], s3_uri[sep + 1:]
 
 
 def build_s3_uri(bucket: str, key: str) -> str:
@@ -0,0 +1,102 @@
+"""
+Tests for DeltaReader's transaction log replay.
+"""
+
+import io
+import json
+import unittest
+
+from botocore.exceptions import ClientError
+
+from src.readers.delta_reader import DeltaReader
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 calls DeltaReader makes."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.read_keys = []
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self.read_keys.append(Key)
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def head_object(self, Bucket, Key, **kwargs):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {}
+
+    def get_paginator(self, name):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix, Delimiter=None, StartAfter=""):
+                keys = sorted(
+                    key for key in client.objects
+                    if key.startswith(Prefix) and key > StartAfter
+                    and "/" not in key[len(Prefix):]
+                )
+                yield {"Contents": [{"Key": key} for key in keys]}
+
+        return Paginator()
+
+
+def _schema(*names):
+    return json.dumps({"fields": [
+        {"name": name, "type": "long", "nullable": True, "metadata": {}} for name in names
+    ]})
+
+
+def _commit(*actions):
+    return "\n".join(json.dumps(action) for action in actions).encode()
+
+
+class DeltaReaderLogReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        log = "t/_delta_log/"
+        self.objects = {
+            f"{log}_last_checkpoint": json.dumps({"version": 10, "size": 3}).encode(),
+            # Unreadable on purpose: the replay must not need the checkpoint
+            f"{log}{10:020d}.checkpoint.parquet": b"PAR1",
+        }
+        for version in range(10, 16):
+            self.objects[f"{log}{version:020d}.json"] = _commit(
+                {"commitInfo": {"version": version}},
+                {"add": {"path": f"part-{version}.parquet"}},
+            )
+        # Schema change between the checkpoint and the latest commit
+        self.objects[f"{log}{12:020d}.json"] = _commit(
+            {"protocol": {"minReaderVersion": 1, "minWriterVersion": 2}},
+            {"metaData": {
+                "id": "t",
+                "schemaString": _schema("id", "amount"),
+                "partitionColumns": [],
+                "configuration": {},
+            }},
+        )
+        self.client = FakeS3Client(self.objects)
+        self.reader = DeltaReader(s3_client=self.client, metadata_max_staleness=0)
+
+    def test_schema_change_in_intermediate_commit(self):
+        metadata = self.reader.read_metadata("s3://bucket/t")
+
+        self.assertEqual(metadata["version"], 15)
+        self.assertEqual([field["name"] for field in metadata["schema"]], ["id", "amount"])
+        self.assertEqual(metadata["protocol"], {"minReaderVersion": 1, "minWriterVersion": 2})
+
+    def test_replay_stops_once_metadata_found(self):
+        self.reader.read_metadata("s3://bucket/t")
+
+        read_commits = [key for key in self.client.read_keys if key.endswith(".json")]
+        self.assertEqual(read_commits, [
+            f"t/_delta_log/{version:020d}.json" for version in (15, 14, 13, 12)
+        ])
+        self.assertFalse(any(key.endswith(".parquet") for key in self.client.read_keys))
+
+
+if __name__ == "__main__":
+    unittest.main()